@@ -141,15 +141,13 @@ class Account:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Account):
             return False
-        return all(
-            [
-                self.channel == other.channel,
-                self.token == other.token,
-                self.url == other.url,
-                self.instance == other.instance,
-                self.proxies == other.proxies,
-                self.verify == other.verify,
-            ]
+        return (
+            self.channel == other.channel
+            and self.token == other.token
+            and self.url == other.url
+            and self.instance == other.instance
+            and self.verify == other.verify
+            and self.proxies == other.proxies
         )
 
     def validate(self) -> "Account":
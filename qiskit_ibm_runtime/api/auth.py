@@ -28,12 +28,7 @@ class CloudAuth(AuthBase):
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, CloudAuth):
-            return all(
-                [
-                    self.api_key == other.api_key,
-                    self.crn == other.crn,
-                ]
-            )
+            return self.api_key == other.api_key and self.crn == other.crn
         return False
 
     def __call__(self, r: PreparedRequest) -> PreparedRequest:
@@ -12,7 +12,95 @@
 
 """Base REST adapter."""
 
+import copy
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type
+
+from requests import Response
+
 from ..session import RetrySession
+from ...utils.json import HAS_ORJSON
+
+if HAS_ORJSON:
+    import orjson
+
+
+class _CacheEntry(NamedTuple):
+    """Cached decoded response of a ``GET`` request."""
+
+    expires_at: float
+    etag: Optional[str]
+    payload: Any
+
+
+_RESPONSE_CACHE: Dict[Tuple, _CacheEntry] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_CACHE_MAXSIZE = 128
+
+
+def json_from_response(response: Response) -> Any:
+    """Decode the JSON body of a response.
+
+    ``orjson`` is used when it is installed. Bodies it rejects but the standard library
+    decoder used by ``requests`` accepts, such as ``NaN`` literals or integers wider
+    than 64 bits, are decoded with the latter.
+
+    Args:
+        response: Response to decode.
+
+    Returns:
+        The decoded JSON body.
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+    return response.json()
+
+
+def clear_response_cache() -> None:
+    """Clear the responses cached by :meth:`RestAdapterBase._cached_get`."""
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE.clear()
+
+
+def _store_response(key: Tuple, entry: _CacheEntry) -> None:
+    """Add an entry to the response cache.
+
+    Expired entries are evicted first and, if the cache is still full, the oldest
+    entries are dropped.
+    """
+    with _RESPONSE_CACHE_LOCK:
+        now = time.monotonic()
+        for expired in [k for k, v in _RESPONSE_CACHE.items() if v.expires_at <= now]:
+            del _RESPONSE_CACHE[expired]
+        _RESPONSE_CACHE.pop(key, None)
+        while len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_MAXSIZE:
+            del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+        _RESPONSE_CACHE[key] = entry
+
+
+def _auth_key(session: RetrySession) -> str:
+    """Return a digest identifying the credentials used by a session."""
+    headers = session.auth.get_headers() if hasattr(session.auth, "get_headers") else {}
+    return hashlib.sha256(repr(sorted(headers.items())).encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _resolve_urls(adapter_cls: Type["RestAdapterBase"], prefix_url: str) -> Dict[str, str]:
+    """Return the URLs of all endpoints of an adapter class for the given prefix.
+
+    Adapters for a single job or session are created on every call, so polling
+    the same job reuses the URLs resolved for it the first time.
+    """
+    return {identifier: prefix_url + path for identifier, path in adapter_cls.URL_MAP.items()}
 
 
 class RestAdapterBase:
@@ -32,6 +120,7 @@ class RestAdapterBase:
         """
         self.session = session
         self.prefix_url = prefix_url
+        self._urls = _resolve_urls(type(self), prefix_url)  # type: ignore[arg-type]
 
     def get_url(self, identifier: str) -> str:
         """Return the resolved URL for the specified identifier.
@@ -42,4 +131,48 @@ class RestAdapterBase:
         Returns:
             The resolved URL of the endpoint (relative to the session base URL).
         """
-        return "{}{}".format(self.prefix_url, self.URL_MAP[identifier])
+        return self._urls[identifier]
+
+    def _cached_get(
+        self,
+        url: str,
+        ttl: float,
+        decoder: Callable[[Response], Any] = json_from_response,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a ``GET`` request, caching the decoded response for ``ttl`` seconds.
+
+        The cache is keyed by URL, query parameters and credentials, so responses are
+        never shared between users. Once an entry expires it is revalidated with
+        ``If-None-Match`` if the server sent an ``ETag``, and a ``304`` response reuses
+        the cached body. Responses marked ``Cache-Control: no-store`` are not cached.
+        At most ``_RESPONSE_CACHE_MAXSIZE`` responses are kept.
+
+        Args:
+            url: URL of the endpoint.
+            ttl: Number of seconds a response is considered fresh.
+            decoder: Function used to decode the response.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            A copy of the decoded response.
+        """
+        params = kwargs.get("params") or {}
+        key = (self.session.base_url, url, tuple(sorted(params.items())), _auth_key(self.session))
+        entry = _RESPONSE_CACHE.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return copy.deepcopy(entry.payload)
+
+        headers = kwargs.pop("headers", {})
+        if entry is not None and entry.etag:
+            headers = {**headers, "If-None-Match": entry.etag}
+        response = self.session.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            payload = entry.payload
+        else:
+            payload = decoder(response)
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            etag = response.headers.get("ETag", entry.etag if entry else None)
+            _store_response(key, _CacheEntry(time.monotonic() + ttl, etag, payload))
+        return copy.deepcopy(payload)
@@ -15,7 +15,7 @@
 from typing import Dict, Any, Optional
 from datetime import datetime as python_datetime
 
-from qiskit_ibm_runtime.api.rest.base import RestAdapterBase
+from qiskit_ibm_runtime.api.rest.base import RestAdapterBase, json_from_response
 from ..session import RetrySession
 
 
@@ -46,8 +46,8 @@ class CloudBackend(RestAdapterBase):
         Returns:
             JSON response of backend configuration.
         """
-        url = self.get_url("configuration")
-        return self.session.get(url).json()
+        url = self._urls["configuration"]
+        return json_from_response(self.session.get(url))
 
     def properties(self, datetime: Optional[python_datetime] = None) -> Dict[str, Any]:
         """Return backend properties.
@@ -55,13 +55,13 @@ class CloudBackend(RestAdapterBase):
         Returns:
             JSON response of backend properties.
         """
-        url = self.get_url("properties")
+        url = self._urls["properties"]
 
         params = {}
         if datetime:
             params["updated_before"] = datetime.isoformat()
 
-        response = self.session.get(url, params=params).json()
+        response = json_from_response(self.session.get(url, params=params))
         # Adjust name of the backend.
         if response:
             response["backend_name"] = self.backend_name
@@ -73,8 +73,8 @@ class CloudBackend(RestAdapterBase):
         Returns:
             JSON response of pulse defaults.
         """
-        url = self.get_url("pulse_defaults")
-        return self.session.get(url).json()
+        url = self._urls["pulse_defaults"]
+        return json_from_response(self.session.get(url))
 
     def status(self) -> Dict[str, Any]:
         """Return backend status.
@@ -82,8 +82,8 @@ class CloudBackend(RestAdapterBase):
         Returns:
             JSON response of backend status.
         """
-        url = self.get_url("status")
-        response = self.session.get(url).json()
+        url = self._urls["status"]
+        response = json_from_response(self.session.get(url))
         # Adjust fields according to the specs (BackendStatus).
         ret = {
             "backend_name": self.backend_name,
@@ -16,7 +16,7 @@ import json
 from typing import Dict
 from requests import Response
 
-from .base import RestAdapterBase
+from .base import RestAdapterBase, json_from_response
 from ..session import RetrySession
 from ...utils.json import RuntimeDecoder
 
@@ -56,11 +56,11 @@ class ProgramJob(RestAdapterBase):
         payload = {}
         if exclude_params:
             payload["exclude_params"] = "true"
-        return self.session.get(self.get_url("self"), params=payload).json(cls=RuntimeDecoder)
+        return self.session.get(self._urls["self"], params=payload).json(cls=RuntimeDecoder)
 
     def delete(self) -> None:
         """Delete program job."""
-        self.session.delete(self.get_url("self"))
+        self.session.delete(self._urls["self"])
 
     def interim_results(self) -> str:
         """Return program job interim results.
@@ -68,7 +68,7 @@ class ProgramJob(RestAdapterBase):
         Returns:
             Interim results.
         """
-        response = self.session.get(self.get_url("interim_results"))
+        response = self.session.get(self._urls["interim_results"])
         return response.text
 
     def results(self) -> str:
@@ -77,12 +77,12 @@ class ProgramJob(RestAdapterBase):
         Returns:
             Job results.
         """
-        response = self.session.get(self.get_url("results"))
+        response = self.session.get(self._urls["results"])
         return response.text
 
     def cancel(self) -> None:
         """Cancel the job."""
-        self.session.post(self.get_url("cancel"))
+        self.session.post(self._urls["cancel"])
 
     def logs(self) -> str:
         """Retrieve job logs.
@@ -90,7 +90,7 @@ class ProgramJob(RestAdapterBase):
         Returns:
             Job logs.
         """
-        return self.session.get(self.get_url("logs")).text
+        return self.session.get(self._urls["logs"]).text
 
     def metadata(self) -> Dict:
         """Retrieve job metadata.
@@ -98,7 +98,7 @@ class ProgramJob(RestAdapterBase):
         Returns:
             Job Metadata.
         """
-        return self.session.get(self.get_url("metrics")).json()
+        return json_from_response(self.session.get(self._urls["metrics"]))
 
     def update_tags(self, tags: list) -> Response:
         """Update job tags.
@@ -106,4 +106,4 @@ class ProgramJob(RestAdapterBase):
         Returns:
             API Response.
         """
-        return self.session.put(self.get_url("tags"), data=json.dumps({"tags": tags}))
+        return self.session.put(self._urls["tags"], data=json.dumps({"tags": tags}))
@@ -16,11 +16,17 @@ import logging
 from typing import Dict, List, Any, Union
 import json
 
-from .base import RestAdapterBase
+from requests import Response
+
+from .base import RestAdapterBase, json_from_response
 from .program_job import ProgramJob
 
 logger = logging.getLogger(__name__)
 
+# Number of seconds the responses of near-static endpoints are cached.
+VERSION_CACHE_TTL = 3600
+USER_INFO_CACHE_TTL = 600
+
 
 class Api(RestAdapterBase):
     """Rest adapter for general endpoints."""
@@ -52,8 +58,8 @@ class Api(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("hubs")
-        return self.session.get(url).json()
+        url = self._urls["hubs"]
+        return json_from_response(self.session.get(url))
 
     def version(self) -> Dict[str, Union[str, bool]]:
         """Return the version information.
@@ -68,16 +74,8 @@ class Api(RestAdapterBase):
 
                 * ``api-*`` (str): The versions of each individual API component
         """
-        url = self.get_url("version")
-        response = self.session.get(url)
-
-        try:
-            version_info = response.json()
-            version_info["new_api"] = True
-        except json.JSONDecodeError:
-            return {"new_api": False, "api": response.text}
-
-        return version_info
+        url = self._urls["version"]
+        return self._cached_get(url, VERSION_CACHE_TTL, decoder=_decode_version)
 
     def login(self, api_token: str) -> Dict[str, Any]:
         """Login with token.
@@ -88,8 +86,8 @@ class Api(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("login")
-        return self.session.post(url, json={"apiToken": api_token}).json()
+        url = self._urls["login"]
+        return json_from_response(self.session.post(url, json={"apiToken": api_token}))
 
     def user_info(self) -> Dict[str, Any]:
         """Return user information.
@@ -97,7 +95,23 @@ class Api(RestAdapterBase):
         Returns:
             JSON response of user information.
         """
-        url = self.get_url("user_info")
-        response = self.session.get(url).json()
+        url = self._urls["user_info"]
+        return self._cached_get(url, USER_INFO_CACHE_TTL)
+
+
+def _decode_version(response: Response) -> Dict[str, Union[str, bool]]:
+    """Decode the response of the version endpoint.
+
+    Args:
+        response: Response of the version endpoint.
+
+    Returns:
+        The version information.
+    """
+    try:
+        version_info = json_from_response(response)
+        version_info["new_api"] = True
+    except json.JSONDecodeError:
+        return {"new_api": False, "api": response.text}
 
-        return response
+    return version_info
@@ -13,20 +13,50 @@
 """Runtime REST adapter."""
 
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Union, Optional
-import json
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
-from qiskit_ibm_runtime.api.rest.base import RestAdapterBase
+from qiskit_ibm_runtime.api.rest.base import RestAdapterBase, json_from_response
 from qiskit_ibm_runtime.api.rest.program_job import ProgramJob
 from qiskit_ibm_runtime.utils import local_to_utc
 from .runtime_session import RuntimeSession
 
-from ...utils import RuntimeEncoder
+from ...utils.json import runtime_dumps
+
 from .cloud_backend import CloudBackend
 
 logger = logging.getLogger(__name__)
 
+# Number of seconds the list of backends is cached.
+BACKENDS_CACHE_TTL = 60
+
+# Query string values of boolean filters.
+_BOOL_STR = {True: "true", False: "false"}
+
+
+@lru_cache(maxsize=128)
+def _query_string(params: Tuple[Tuple[str, Any], ...]) -> str:
+    """Return the encoded query string for ``params``.
+
+    Pollers list jobs with the same filters over and over, so the encoded
+    result is memoized.
+    """
+    return urlencode(params, doseq=True)
+
+
+@lru_cache(maxsize=512)
+def _utc_isoformat(
+    local_dt: datetime, utcoffset: Optional[timedelta]  # pylint: disable=unused-argument
+) -> str:
+    """Return ``local_dt`` converted to UTC, in ISO format.
+
+    ``utcoffset`` is part of the cache key because aware datetimes that represent
+    the same instant compare equal, but are converted based on their own offset.
+    """
+    return local_to_utc(local_dt).isoformat()
+
 
 class Runtime(RestAdapterBase):
     """Rest adapter for Runtime base endpoints."""
@@ -98,34 +128,29 @@ class Runtime(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("jobs")
-        payload: Dict[str, Any] = {
-            "program_id": program_id,
-            "params": params,
-        }
-        if image:
-            payload["runtime"] = image
-        if log_level:
-            payload["log_level"] = log_level
-        if backend_name:
-            payload["backend"] = backend_name
-        if session_id:
-            payload["session_id"] = session_id
-        if job_tags:
-            payload["tags"] = job_tags
-        if max_execution_time:
-            payload["cost"] = max_execution_time
-        if start_session:
-            payload["start_session"] = start_session
-            payload["session_time"] = session_time
-        if all([hub, group, project]):
-            payload["hub"] = hub
-            payload["group"] = group
-            payload["project"] = project
-        if channel_strategy:
-            payload["channel_strategy"] = channel_strategy
-        data = json.dumps(payload, cls=RuntimeEncoder)
-        return self.session.post(url, data=data, timeout=900).json()
+        url = self._urls["jobs"]
+        has_hgp = all([hub, group, project])
+        fields = (
+            ("program_id", program_id, True),
+            ("params", params, True),
+            ("runtime", image, image),
+            ("log_level", log_level, log_level),
+            ("backend", backend_name, backend_name),
+            ("session_id", session_id, session_id),
+            ("tags", job_tags, job_tags),
+            ("cost", max_execution_time, max_execution_time),
+            ("start_session", start_session, start_session),
+            ("session_time", session_time, start_session),
+            ("hub", hub, has_hgp),
+            ("group", group, has_hgp),
+            ("project", project, has_hgp),
+            ("channel_strategy", channel_strategy, channel_strategy),
+        )
+        payload = {key: value for key, value, include in fields if include}
+        data = runtime_dumps(payload)
+        return json_from_response(
+            self.session.post(url, data=data, headers=self._HEADER_JSON_CONTENT, timeout=900)
+        )
 
     def jobs_get(
         self,
@@ -169,32 +194,40 @@ class Runtime(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("jobs")
-        payload: Dict[str, Union[int, str, List[str]]] = {}
-        payload["exclude_params"] = False
-        if limit:
-            payload["limit"] = limit
-        if skip:
-            payload["offset"] = skip
-        if backend_name:
-            payload["backend"] = backend_name
-        if pending is not None:
-            payload["pending"] = "true" if pending else "false"
-        if program_id:
-            payload["program"] = program_id
-        if job_tags:
-            payload["tags"] = job_tags
-        if session_id:
-            payload["session_id"] = session_id
-        if created_after:
-            payload["created_after"] = local_to_utc(created_after).isoformat()
-        if created_before:
-            payload["created_before"] = local_to_utc(created_before).isoformat()
-        if descending is False:
-            payload["sort"] = "ASC"
-        if all([hub, group, project]):
-            payload["provider"] = f"{hub}/{group}/{project}"
-        return self.session.get(url, params=payload).json()
+        url = self._urls["jobs"]
+        has_hgp = all([hub, group, project])
+        fields = (
+            ("exclude_params", False, True),
+            ("limit", limit, limit),
+            ("offset", skip, skip),
+            ("backend", backend_name, backend_name),
+            ("pending", _BOOL_STR[bool(pending)], pending is not None),
+            ("program", program_id, program_id),
+            ("tags", job_tags, job_tags),
+            ("session_id", session_id, session_id),
+            (
+                "created_after",
+                _utc_isoformat(created_after, created_after.utcoffset()) if created_after else None,
+                created_after,
+            ),
+            (
+                "created_before",
+                (
+                    _utc_isoformat(created_before, created_before.utcoffset())
+                    if created_before
+                    else None
+                ),
+                created_before,
+            ),
+            ("sort", "ASC", descending is False),
+            ("provider", f"{hub}/{group}/{project}", has_hgp),
+        )
+        params = tuple(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value, include in fields
+            if include
+        )
+        return json_from_response(self.session.get(f"{url}?{_query_string(params)}"))
 
     def backend(self, backend_name: str) -> CloudBackend:
         """Return an adapter for the IBM backend.
@@ -223,13 +256,13 @@ class Runtime(RestAdapterBase):
         Returns:
             JSON response.
         """
-        url = self.get_url("backends")
+        url = self._urls["backends"]
         params = {}
         if hgp:
             params["provider"] = hgp
         if channel_strategy:
             params["channel_strategy"] = channel_strategy
-        return self.session.get(url, params=params, timeout=timeout).json()
+        return self._cached_get(url, BACKENDS_CACHE_TTL, params=params, timeout=timeout)
 
     def is_qctrl_enabled(self) -> bool:
         """Return boolean of whether or not the instance has q-ctrl enabled.
@@ -237,5 +270,5 @@ class Runtime(RestAdapterBase):
         Returns:
             Boolean value.
         """
-        url = self.get_url("cloud_instance")
-        return self.session.get(url).json().get("qctrl_enabled")
+        url = self._urls["cloud_instance"]
+        return json_from_response(self.session.get(url)).get("qctrl_enabled")
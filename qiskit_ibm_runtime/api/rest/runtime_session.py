@@ -13,7 +13,7 @@
 """Runtime Session REST adapter."""
 
 from typing import Dict, Any, Optional
-from .base import RestAdapterBase
+from .base import RestAdapterBase, json_from_response
 from ..session import RetrySession
 from ..exceptions import RequestsApiError
 from ...exceptions import IBMRuntimeError
@@ -49,7 +49,7 @@ class RuntimeSession(RestAdapterBase):
         mode: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Create a session"""
-        url = self.get_url("self")
+        url = self._urls["self"]
         payload = {}
         if mode:
             payload["mode"] = mode
@@ -62,17 +62,17 @@ class RuntimeSession(RestAdapterBase):
                 payload["max_session_ttl"] = max_time  # type: ignore[assignment]
             else:
                 payload["max_ttl"] = max_time  # type: ignore[assignment]
-        return self.session.post(url, json=payload).json()
+        return json_from_response(self.session.post(url, json=payload))
 
     def cancel(self) -> None:
         """Cancel all jobs in the session."""
-        url = self.get_url("close")
+        url = self._urls["close"]
         self.session.delete(url)
 
     def close(self) -> None:
         """Set accepting_jobs flag to false, so no more jobs can be submitted."""
         payload = {"accepting_jobs": False}
-        url = self.get_url("self")
+        url = self._urls["self"]
         try:
             self.session.patch(url, json=payload)
         except RequestsApiError as ex:
@@ -83,4 +83,4 @@ class RuntimeSession(RestAdapterBase):
 
     def details(self) -> Dict[str, Any]:
         """Return the details of this session."""
-        return self.session.get(self.get_url("self")).json()
+        return json_from_response(self.session.get(self._urls["self"]))
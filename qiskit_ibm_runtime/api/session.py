@@ -17,6 +17,7 @@ import os
 import re
 import logging
 import sys
+import threading
 from typing import Dict, Optional, Any, Tuple, Union
 from pathlib import PurePath
 import importlib.metadata
@@ -45,6 +46,18 @@ STATUS_FORCELIST = (
 CUSTOM_HEADER_ENV_VAR = "QISKIT_IBM_RUNTIME_CUSTOM_CLIENT_APP_HEADER"
 QE_PROVIDER_HEADER_ENV_VAR = "QE_CUSTOM_CLIENT_APP_HEADER"
 USAGE_DATA_OPT_OUT_ENV_VAR = "USAGE_DATA_OPT_OUT"
+# Callers reported in the client application header, unless usage data is opted out.
+USAGE_DATA_CALLERS = {
+    PurePath("qiskit/algorithms"),
+    PurePath("qiskit_ibm_runtime/sampler.py"),
+    PurePath("qiskit_ibm_runtime/estimator.py"),
+    "qiskit_machine_learning",
+    "qiskit_nature",
+    "qiskit_optimization",
+    "qiskit_experiments",
+    "qiskit_finance",
+    "circuit_knitting_toolbox",
+}
 
 logger = logging.getLogger(__name__)
 # Regex used to match the `/backends` endpoint, capturing the device name as group(2).
@@ -53,6 +66,13 @@ logger = logging.getLogger(__name__)
 # Capture groups: (/backends/)(<device_name>)(</optional rest of the url>)
 RE_BACKENDS_ENDPOINT = re.compile(r"^(.*/backends/)([^/}]{2,})(.*)$", re.IGNORECASE)
 
+# Connection pool sizes of the retry adapters shared by all sessions.
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+_SHARED_ADAPTERS: Dict[Tuple[int, int, float, bool], HTTPAdapter] = {}
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
 
 def _get_client_header() -> str:
     """Return the client version."""
@@ -149,6 +169,45 @@ class PostForcelistRetry(Retry):
         return super().is_retry(method, status_code, has_retry_after)
 
 
+def _get_shared_adapter(
+    retries_total: int, retries_connect: int, backoff_factor: float, verify: bool
+) -> HTTPAdapter:
+    """Return the retry adapter shared by all sessions with the same retry policy.
+
+    Sharing the adapter lets every session (for example, the clients created for
+    each hub/group/project) reuse the same pooled keep-alive connections instead of
+    paying a new TCP and TLS handshake per session. Older ``requests`` versions do
+    not key pooled connections on ``verify``, so sessions with different ``verify``
+    settings never share an adapter.
+
+    Args:
+        retries_total: Number of total retries for the requests.
+        retries_connect: Number of connect retries for the requests.
+        backoff_factor: Backoff factor between retry attempts.
+        verify: Whether SSL verification is enabled for the session.
+
+    Returns:
+        The shared adapter.
+    """
+    key = (retries_total, retries_connect, backoff_factor, verify)
+    with _SHARED_ADAPTERS_LOCK:
+        adapter = _SHARED_ADAPTERS.get(key)
+        if adapter is None:
+            retry = PostForcelistRetry(
+                total=retries_total,
+                connect=retries_connect,
+                backoff_factor=backoff_factor,
+                status_forcelist=STATUS_FORCELIST,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=retry,
+            )
+            _SHARED_ADAPTERS[key] = adapter
+    return adapter
+
+
 class RetrySession(Session):
     """Custom session with retry and handling of specific parameters.
 
@@ -184,7 +243,7 @@ class RetrySession(Session):
 
         self.base_url = base_url
         self.custom_header: Optional[str] = None
-        self._initialize_retry(retries_total, retries_connect, backoff_factor)
+        self._initialize_retry(retries_total, retries_connect, backoff_factor, verify)
         self._initialize_session_parameters(verify, proxies or {}, auth)
         self._timeout = timeout
 
@@ -196,8 +255,19 @@ class RetrySession(Session):
             # ignore errors that may happen during cleanup
             pass
 
+    def close(self) -> None:
+        """Close the session.
+
+        Adapters shared with other sessions are left open so their pooled
+        connections remain available.
+        """
+        shared = list(_SHARED_ADAPTERS.values())
+        for adapter in self.adapters.values():
+            if not any(adapter is shared_adapter for shared_adapter in shared):
+                adapter.close()
+
     def _initialize_retry(
-        self, retries_total: int, retries_connect: int, backoff_factor: float
+        self, retries_total: int, retries_connect: int, backoff_factor: float, verify: bool
     ) -> None:
         """Set the session retry policy.
 
@@ -205,15 +275,9 @@ class RetrySession(Session):
             retries_total: Number of total retries for the requests.
             retries_connect: Number of connect retries for the requests.
             backoff_factor: Backoff factor between retry attempts.
+            verify: Whether to enable SSL verification.
         """
-        retry = PostForcelistRetry(
-            total=retries_total,
-            connect=retries_connect,
-            backoff_factor=backoff_factor,
-            status_forcelist=STATUS_FORCELIST,
-        )
-
-        retry_adapter = HTTPAdapter(max_retries=retry)
+        retry_adapter = _get_shared_adapter(retries_total, retries_connect, backoff_factor, verify)
         self.mount("http://", retry_adapter)
         self.mount("https://", retry_adapter)
 
@@ -277,25 +341,20 @@ class RetrySession(Session):
         headers.update({"X-Qx-Client-Application": f"{CLIENT_APPLICATION}/qiskit"})
 
         if not os.getenv(USAGE_DATA_OPT_OUT_ENV_VAR, "False") == "True":
-            # Use PurePath in order to support arbitrary path formats
-            callers = {
-                PurePath("qiskit/algorithms"),
-                PurePath("qiskit_ibm_runtime/sampler.py"),
-                PurePath("qiskit_ibm_runtime/estimator.py"),
-                "qiskit_machine_learning",
-                "qiskit_nature",
-                "qiskit_optimization",
-                "qiskit_experiments",
-                "qiskit_finance",
-                "circuit_knitting_toolbox",
-            }
-            stack = inspect.stack()
-            stack.reverse()
+            # Only the file names of the calling frames are needed, so walk the
+            # frames directly instead of building the full ``inspect.stack()``.
+            filenames = []
+            frame = inspect.currentframe()
+            while frame is not None:
+                filenames.append(frame.f_code.co_filename)
+                frame = frame.f_back
+            filenames.reverse()
 
             found_caller = False
-            for frame in stack:
-                frame_path = str(PurePath(frame.filename))
-                for caller in callers:
+            for filename in filenames:
+                # Use PurePath in order to support arbitrary path formats
+                frame_path = str(PurePath(filename))
+                for caller in USAGE_DATA_CALLERS:
                     if str(caller) in frame_path:
                         caller_str = str(caller) + frame_path.split(str(caller), 1)[-1]
                         if os.name == "nt":
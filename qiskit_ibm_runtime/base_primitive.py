@@ -17,7 +17,7 @@ from abc import ABC, abstractmethod
 from typing import Dict, Optional, Any, Union, TypeVar, Generic, Type
 import copy
 import logging
-from dataclasses import asdict, replace
+from dataclasses import asdict
 import warnings
 
 from pydantic import ValidationError
@@ -212,7 +212,7 @@ class BasePrimitiveV2(ABC, Generic[OptionsT]):
                 )
 
         elif isinstance(options, self._options_class):
-            self._options = replace(options)
+            self._options = copy.deepcopy(options)
         else:
             raise TypeError(
                 f"Invalid 'options' type. It can only be a dictionary of {self._options_class}"
@@ -19,6 +19,7 @@ import logging
 from concurrent import futures
 import traceback
 import queue
+import time
 from datetime import datetime
 import requests
 
@@ -46,6 +47,9 @@ from .api.client_parameters import ClientParameters
 
 logger = logging.getLogger(__name__)
 
+# Seconds for which a fetched job response is reused by status and metadata lookups.
+_JOB_RESPONSE_TTL = 0.05
+
 
 class BaseRuntimeJob(ABC):
     """Base Runtime Job class."""
@@ -112,6 +116,7 @@ class BaseRuntimeJob(ABC):
         self._queue_info: QueueInfo = None
         self._user_callback = user_callback
         self._status: Union[RuntimeJobStatus, str] = None
+        self._job_response: Optional[Tuple[float, Dict]] = None
 
         decoder = result_decoder or DEFAULT_DECODERS.get(program_id, None) or ResultDecoder
         if isinstance(decoder, Sequence):
@@ -221,10 +226,27 @@ class BaseRuntimeJob(ABC):
         self._set_status_and_error_message()
         return self._error_message
 
+    def _get_job_response(self) -> Dict:
+        """Return the job as returned by the runtime API.
+
+        A response fetched within the last few milliseconds is reused, so that
+        back-to-back status and metadata lookups share a single request.
+
+        Returns:
+            Job response from the runtime API.
+        """
+        if self._job_response is not None:
+            fetched_at, response = self._job_response
+            if time.monotonic() - fetched_at < _JOB_RESPONSE_TTL:
+                return response
+        response = self._api_client.job_get(job_id=self.job_id())
+        self._job_response = (time.monotonic(), response)
+        return response
+
     def _set_status_and_error_message(self) -> None:
         """Fetch and set status and error message."""
         if self._status not in self.JOB_FINAL_STATES:
-            response = self._api_client.job_get(job_id=self.job_id())
+            response = self._get_job_response()
             self._set_status(response)
             self._set_error_message(response)
 
@@ -422,7 +444,7 @@ class BaseRuntimeJob(ABC):
             ``None`` if creation date is not available.
         """
         if not self._creation_date:
-            response = self._api_client.job_get(job_id=self.job_id())
+            response = self._get_job_response()
             self._creation_date = response.get("created", None)
 
         if not self._creation_date:
@@ -438,7 +460,7 @@ class BaseRuntimeJob(ABC):
             Session ID. None if the backend is a simulator.
         """
         if not self._session_id:
-            response = self._api_client.job_get(job_id=self.job_id())
+            response = self._get_job_response()
             self._session_id = response.get("session_id", None)
         return self._session_id
 
@@ -461,9 +483,9 @@ class BaseRuntimeJob(ABC):
             the system is dedicated to processing your job.
         """
         if not self._usage_estimation:
-            response = self._api_client.job_get(job_id=self.job_id())
+            response = self._get_job_response()
             self._usage_estimation = {
-                "quantum_seconds": response.pop("estimated_running_time_seconds", None),
+                "quantum_seconds": response.get("estimated_running_time_seconds", None),
             }
 
         return self._usage_estimation
@@ -223,8 +223,128 @@ Fake V1 backends are fake backends with IBM Quantum systems snapshots implemente
     FakeYorktown
 """
 
+from typing import TYPE_CHECKING, Any, List
+
 # Fake providers
 from .fake_provider import FakeProviderFactory, FakeProviderForBackendV2, FakeProvider
 
-# Standard fake backends with IBM Quantum systems snapshots
-from .backends import *
+# Standard fake backends with IBM Quantum systems snapshots, imported on first access
+from . import backends
+
+__all__ = ["FakeProviderFactory", "FakeProviderForBackendV2", "FakeProvider", *backends.__all__]
+
+if TYPE_CHECKING:
+    from .backends import (
+        FakeAlgiers,
+        FakeAlmadenV2,
+        FakeArmonkV2,
+        FakeAthensV2,
+        FakeAuckland,
+        FakeBelemV2,
+        FakeBoeblingenV2,
+        FakeBogotaV2,
+        FakeBrisbane,
+        FakeBrooklynV2,
+        FakeBurlingtonV2,
+        FakeCairoV2,
+        FakeCambridgeV2,
+        FakeCasablancaV2,
+        FakeCusco,
+        FakeEssexV2,
+        FakeFractionalBackend,
+        FakeGeneva,
+        FakeGuadalupeV2,
+        FakeHanoiV2,
+        FakeJakartaV2,
+        FakeJohannesburgV2,
+        FakeKawasaki,
+        FakeKolkataV2,
+        FakeKyiv,
+        FakeKyoto,
+        FakeLagosV2,
+        FakeLimaV2,
+        FakeLondonV2,
+        FakeManhattanV2,
+        FakeManilaV2,
+        FakeMelbourneV2,
+        FakeMontrealV2,
+        FakeMumbaiV2,
+        FakeNairobiV2,
+        FakeOsaka,
+        FakeOslo,
+        FakeOurenseV2,
+        FakeParisV2,
+        FakePeekskill,
+        FakePerth,
+        FakePrague,
+        FakePoughkeepsieV2,
+        FakeQuebec,
+        FakeQuitoV2,
+        FakeRochesterV2,
+        FakeRomeV2,
+        FakeSantiagoV2,
+        FakeSherbrooke,
+        FakeSingaporeV2,
+        FakeSydneyV2,
+        FakeTorino,
+        FakeTorontoV2,
+        FakeValenciaV2,
+        FakeVigoV2,
+        FakeWashingtonV2,
+        FakeYorktownV2,
+        FakeAlmaden,
+        FakeArmonk,
+        FakeAthens,
+        FakeBelem,
+        FakeBoeblingen,
+        FakeBogota,
+        FakeBrooklyn,
+        FakeBurlington,
+        FakeCairo,
+        FakeCambridge,
+        FakeCambridgeAlternativeBasis,
+        FakeCasablanca,
+        FakeEssex,
+        FakeGuadalupe,
+        FakeHanoi,
+        FakeJakarta,
+        FakeJohannesburg,
+        FakeKolkata,
+        FakeLagos,
+        FakeLima,
+        FakeLondon,
+        FakeManhattan,
+        FakeManila,
+        FakeMelbourne,
+        FakeMontreal,
+        FakeMumbai,
+        FakeNairobi,
+        FakeOurense,
+        FakeParis,
+        FakePoughkeepsie,
+        FakeQuito,
+        FakeRochester,
+        FakeRome,
+        FakeRueschlikon,
+        FakeSantiago,
+        FakeSingapore,
+        FakeSydney,
+        FakeTenerife,
+        FakeTokyo,
+        FakeToronto,
+        FakeValencia,
+        FakeVigo,
+        FakeWashington,
+        FakeYorktown,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Return the fake backend class ``name`` from :mod:`.backends`."""
+    if name in backends.__all__:
+        return getattr(backends, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
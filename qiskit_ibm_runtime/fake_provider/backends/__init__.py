@@ -13,109 +13,238 @@
 
 """
 Mocked versions of real quantum backends.
+
+The backend classes are imported lazily, the first time they are accessed, so that
+importing :mod:`qiskit_ibm_runtime` does not load every fake backend module.
 """
 
-# BackendV2 Backends
-from .algiers import FakeAlgiers
-from .almaden import FakeAlmadenV2
-from .armonk import FakeArmonkV2
-from .athens import FakeAthensV2
-from .auckland import FakeAuckland
-from .belem import FakeBelemV2
-from .boeblingen import FakeBoeblingenV2
-from .bogota import FakeBogotaV2
-from .brisbane import FakeBrisbane
-from .brooklyn import FakeBrooklynV2
-from .burlington import FakeBurlingtonV2
-from .cairo import FakeCairoV2
-from .cambridge import FakeCambridgeV2
-from .casablanca import FakeCasablancaV2
-from .cusco import FakeCusco
-from .essex import FakeEssexV2
-from .fractional import FakeFractionalBackend
-from .geneva import FakeGeneva
-from .guadalupe import FakeGuadalupeV2
-from .hanoi import FakeHanoiV2
-from .jakarta import FakeJakartaV2
-from .johannesburg import FakeJohannesburgV2
-from .kawasaki import FakeKawasaki
-from .kolkata import FakeKolkataV2
-from .kyiv import FakeKyiv
-from .kyoto import FakeKyoto
-from .lagos import FakeLagosV2
-from .lima import FakeLimaV2
-from .london import FakeLondonV2
-from .manhattan import FakeManhattanV2
-from .manila import FakeManilaV2
-from .melbourne import FakeMelbourneV2
-from .montreal import FakeMontrealV2
-from .mumbai import FakeMumbaiV2
-from .nairobi import FakeNairobiV2
-from .osaka import FakeOsaka
-from .oslo import FakeOslo
-from .ourense import FakeOurenseV2
-from .paris import FakeParisV2
-from .peekskill import FakePeekskill
-from .perth import FakePerth
-from .prague import FakePrague
-from .poughkeepsie import FakePoughkeepsieV2
-from .quebec import FakeQuebec
-from .quito import FakeQuitoV2
-from .rochester import FakeRochesterV2
-from .rome import FakeRomeV2
-from .santiago import FakeSantiagoV2
-from .sherbrooke import FakeSherbrooke
-from .singapore import FakeSingaporeV2
-from .sydney import FakeSydneyV2
-from .torino import FakeTorino
-from .toronto import FakeTorontoV2
-from .valencia import FakeValenciaV2
-from .vigo import FakeVigoV2
-from .washington import FakeWashingtonV2
-from .yorktown import FakeYorktownV2
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+# Subpackage defining each fake backend, keyed by class name.
+_BACKENDS: Dict[str, str] = {
+    # BackendV2 Backends
+    "FakeAlgiers": "algiers",
+    "FakeAlmadenV2": "almaden",
+    "FakeArmonkV2": "armonk",
+    "FakeAthensV2": "athens",
+    "FakeAuckland": "auckland",
+    "FakeBelemV2": "belem",
+    "FakeBoeblingenV2": "boeblingen",
+    "FakeBogotaV2": "bogota",
+    "FakeBrisbane": "brisbane",
+    "FakeBrooklynV2": "brooklyn",
+    "FakeBurlingtonV2": "burlington",
+    "FakeCairoV2": "cairo",
+    "FakeCambridgeV2": "cambridge",
+    "FakeCasablancaV2": "casablanca",
+    "FakeCusco": "cusco",
+    "FakeEssexV2": "essex",
+    "FakeFractionalBackend": "fractional",
+    "FakeGeneva": "geneva",
+    "FakeGuadalupeV2": "guadalupe",
+    "FakeHanoiV2": "hanoi",
+    "FakeJakartaV2": "jakarta",
+    "FakeJohannesburgV2": "johannesburg",
+    "FakeKawasaki": "kawasaki",
+    "FakeKolkataV2": "kolkata",
+    "FakeKyiv": "kyiv",
+    "FakeKyoto": "kyoto",
+    "FakeLagosV2": "lagos",
+    "FakeLimaV2": "lima",
+    "FakeLondonV2": "london",
+    "FakeManhattanV2": "manhattan",
+    "FakeManilaV2": "manila",
+    "FakeMelbourneV2": "melbourne",
+    "FakeMontrealV2": "montreal",
+    "FakeMumbaiV2": "mumbai",
+    "FakeNairobiV2": "nairobi",
+    "FakeOsaka": "osaka",
+    "FakeOslo": "oslo",
+    "FakeOurenseV2": "ourense",
+    "FakeParisV2": "paris",
+    "FakePeekskill": "peekskill",
+    "FakePerth": "perth",
+    "FakePrague": "prague",
+    "FakePoughkeepsieV2": "poughkeepsie",
+    "FakeQuebec": "quebec",
+    "FakeQuitoV2": "quito",
+    "FakeRochesterV2": "rochester",
+    "FakeRomeV2": "rome",
+    "FakeSantiagoV2": "santiago",
+    "FakeSherbrooke": "sherbrooke",
+    "FakeSingaporeV2": "singapore",
+    "FakeSydneyV2": "sydney",
+    "FakeTorino": "torino",
+    "FakeTorontoV2": "toronto",
+    "FakeValenciaV2": "valencia",
+    "FakeVigoV2": "vigo",
+    "FakeWashingtonV2": "washington",
+    "FakeYorktownV2": "yorktown",
+    # BackendV1 Backends
+    "FakeAlmaden": "almaden",
+    "FakeArmonk": "armonk",
+    "FakeAthens": "athens",
+    "FakeBelem": "belem",
+    "FakeBoeblingen": "boeblingen",
+    "FakeBogota": "bogota",
+    "FakeBrooklyn": "brooklyn",
+    "FakeBurlington": "burlington",
+    "FakeCairo": "cairo",
+    "FakeCambridge": "cambridge",
+    "FakeCambridgeAlternativeBasis": "cambridge",
+    "FakeCasablanca": "casablanca",
+    "FakeEssex": "essex",
+    "FakeGuadalupe": "guadalupe",
+    "FakeHanoi": "hanoi",
+    "FakeJakarta": "jakarta",
+    "FakeJohannesburg": "johannesburg",
+    "FakeKolkata": "kolkata",
+    "FakeLagos": "lagos",
+    "FakeLima": "lima",
+    "FakeLondon": "london",
+    "FakeManhattan": "manhattan",
+    "FakeManila": "manila",
+    "FakeMelbourne": "melbourne",
+    "FakeMontreal": "montreal",
+    "FakeMumbai": "mumbai",
+    "FakeNairobi": "nairobi",
+    "FakeOurense": "ourense",
+    "FakeParis": "paris",
+    "FakePoughkeepsie": "poughkeepsie",
+    "FakeQuito": "quito",
+    "FakeRochester": "rochester",
+    "FakeRome": "rome",
+    "FakeRueschlikon": "rueschlikon",
+    "FakeSantiago": "santiago",
+    "FakeSingapore": "singapore",
+    "FakeSydney": "sydney",
+    "FakeTenerife": "tenerife",
+    "FakeTokyo": "tokyo",
+    "FakeToronto": "toronto",
+    "FakeValencia": "valencia",
+    "FakeVigo": "vigo",
+    "FakeWashington": "washington",
+    "FakeYorktown": "yorktown",
+}
+
+__all__ = list(_BACKENDS)
+
+if TYPE_CHECKING:
+    # BackendV2 Backends
+    from .algiers import FakeAlgiers
+    from .almaden import FakeAlmadenV2
+    from .armonk import FakeArmonkV2
+    from .athens import FakeAthensV2
+    from .auckland import FakeAuckland
+    from .belem import FakeBelemV2
+    from .boeblingen import FakeBoeblingenV2
+    from .bogota import FakeBogotaV2
+    from .brisbane import FakeBrisbane
+    from .brooklyn import FakeBrooklynV2
+    from .burlington import FakeBurlingtonV2
+    from .cairo import FakeCairoV2
+    from .cambridge import FakeCambridgeV2
+    from .casablanca import FakeCasablancaV2
+    from .cusco import FakeCusco
+    from .essex import FakeEssexV2
+    from .fractional import FakeFractionalBackend
+    from .geneva import FakeGeneva
+    from .guadalupe import FakeGuadalupeV2
+    from .hanoi import FakeHanoiV2
+    from .jakarta import FakeJakartaV2
+    from .johannesburg import FakeJohannesburgV2
+    from .kawasaki import FakeKawasaki
+    from .kolkata import FakeKolkataV2
+    from .kyiv import FakeKyiv
+    from .kyoto import FakeKyoto
+    from .lagos import FakeLagosV2
+    from .lima import FakeLimaV2
+    from .london import FakeLondonV2
+    from .manhattan import FakeManhattanV2
+    from .manila import FakeManilaV2
+    from .melbourne import FakeMelbourneV2
+    from .montreal import FakeMontrealV2
+    from .mumbai import FakeMumbaiV2
+    from .nairobi import FakeNairobiV2
+    from .osaka import FakeOsaka
+    from .oslo import FakeOslo
+    from .ourense import FakeOurenseV2
+    from .paris import FakeParisV2
+    from .peekskill import FakePeekskill
+    from .perth import FakePerth
+    from .prague import FakePrague
+    from .poughkeepsie import FakePoughkeepsieV2
+    from .quebec import FakeQuebec
+    from .quito import FakeQuitoV2
+    from .rochester import FakeRochesterV2
+    from .rome import FakeRomeV2
+    from .santiago import FakeSantiagoV2
+    from .sherbrooke import FakeSherbrooke
+    from .singapore import FakeSingaporeV2
+    from .sydney import FakeSydneyV2
+    from .torino import FakeTorino
+    from .toronto import FakeTorontoV2
+    from .valencia import FakeValenciaV2
+    from .vigo import FakeVigoV2
+    from .washington import FakeWashingtonV2
+    from .yorktown import FakeYorktownV2
+
+    # BackendV1 Backends
+    from .almaden import FakeAlmaden
+    from .armonk import FakeArmonk
+    from .athens import FakeAthens
+    from .belem import FakeBelem
+    from .boeblingen import FakeBoeblingen
+    from .bogota import FakeBogota
+    from .brooklyn import FakeBrooklyn
+    from .burlington import FakeBurlington
+    from .cairo import FakeCairo
+    from .cambridge import FakeCambridge
+    from .cambridge import FakeCambridgeAlternativeBasis
+    from .casablanca import FakeCasablanca
+    from .essex import FakeEssex
+    from .guadalupe import FakeGuadalupe
+    from .hanoi import FakeHanoi
+    from .jakarta import FakeJakarta
+    from .johannesburg import FakeJohannesburg
+    from .kolkata import FakeKolkata
+    from .lagos import FakeLagos
+    from .lima import FakeLima
+    from .london import FakeLondon
+    from .manhattan import FakeManhattan
+    from .manila import FakeManila
+    from .melbourne import FakeMelbourne
+    from .montreal import FakeMontreal
+    from .mumbai import FakeMumbai
+    from .nairobi import FakeNairobi
+    from .ourense import FakeOurense
+    from .paris import FakeParis
+    from .poughkeepsie import FakePoughkeepsie
+    from .quito import FakeQuito
+    from .rochester import FakeRochester
+    from .rome import FakeRome
+    from .rueschlikon import FakeRueschlikon
+    from .santiago import FakeSantiago
+    from .singapore import FakeSingapore
+    from .sydney import FakeSydney
+    from .tenerife import FakeTenerife
+    from .tokyo import FakeTokyo
+    from .toronto import FakeToronto
+    from .valencia import FakeValencia
+    from .vigo import FakeVigo
+    from .washington import FakeWashington
+    from .yorktown import FakeYorktown
+
+
+def __getattr__(name: str) -> Any:
+    """Import a fake backend class on first access."""
+    if name not in _BACKENDS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    backend_class = getattr(importlib.import_module(f".{_BACKENDS[name]}", __name__), name)
+    globals()[name] = backend_class
+    return backend_class
+
 
-# BackendV1 Backends
-from .almaden import FakeAlmaden
-from .armonk import FakeArmonk
-from .athens import FakeAthens
-from .belem import FakeBelem
-from .boeblingen import FakeBoeblingen
-from .bogota import FakeBogota
-from .brooklyn import FakeBrooklyn
-from .burlington import FakeBurlington
-from .cairo import FakeCairo
-from .cambridge import FakeCambridge
-from .cambridge import FakeCambridgeAlternativeBasis
-from .casablanca import FakeCasablanca
-from .essex import FakeEssex
-from .guadalupe import FakeGuadalupe
-from .hanoi import FakeHanoi
-from .jakarta import FakeJakarta
-from .johannesburg import FakeJohannesburg
-from .kolkata import FakeKolkata
-from .lagos import FakeLagos
-from .lima import FakeLima
-from .london import FakeLondon
-from .manhattan import FakeManhattan
-from .manila import FakeManila
-from .melbourne import FakeMelbourne
-from .montreal import FakeMontreal
-from .mumbai import FakeMumbai
-from .nairobi import FakeNairobi
-from .ourense import FakeOurense
-from .paris import FakeParis
-from .poughkeepsie import FakePoughkeepsie
-from .quito import FakeQuito
-from .rochester import FakeRochester
-from .rome import FakeRome
-from .rueschlikon import FakeRueschlikon
-from .santiago import FakeSantiago
-from .singapore import FakeSingapore
-from .sydney import FakeSydney
-from .tenerife import FakeTenerife
-from .tokyo import FakeTokyo
-from .toronto import FakeToronto
-from .valencia import FakeValencia
-from .vigo import FakeVigo
-from .washington import FakeWashington
-from .yorktown import FakeYorktown
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
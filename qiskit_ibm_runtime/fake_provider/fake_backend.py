@@ -19,9 +19,11 @@ import warnings
 import collections
 import json
 import os
-import re
+from string import ascii_letters
+from functools import cached_property
+from types import MappingProxyType
 
-from typing import List, Iterable
+from typing import Any, List, Iterable, Mapping
 
 from qiskit import circuit
 from qiskit.providers.models import BackendProperties, BackendConfiguration, PulseDefaults
@@ -42,11 +44,42 @@ from qiskit.providers.basic_provider import BasicSimulator
 from qiskit_ibm_runtime.utils.backend_converter import convert_to_target
 from .. import QiskitRuntimeService
 from ..utils.backend_encoder import BackendEncoder
+from ..utils.json import HAS_ORJSON
 
 from ..utils.deprecation import issue_deprecation_msg
 
+if HAS_ORJSON:
+    from ..utils.json import orjson
+
 logger = logging.getLogger(__name__)
 
+# Pulse channel classes by the channel type used in the configuration file.
+_CHANNEL_TYPES = {
+    "acquire": pulse.AcquireChannel,
+    "drive": pulse.DriveChannel,
+    "measure": pulse.MeasureChannel,
+    "control": pulse.ControlChannel,
+}
+# Shared read-only result for backends or channel types without channels.
+_NO_CHANNELS: Mapping[Any, Any] = MappingProxyType({})
+
+
+def load_json_file(dirname: str, filename: str) -> dict:
+    """Parse a fake backend snapshot file.
+
+    Args:
+        dirname: Directory containing the file.
+        filename: Name of the JSON file.
+
+    Returns:
+        The parsed JSON document.
+    """
+    with open(os.path.join(dirname, filename), "rb") as f_json:
+        raw = f_json.read()
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class _Credentials:
     def __init__(self, token: str = "123456", url: str = "https://") -> None:
@@ -93,18 +126,18 @@ class FakeBackendV2(BackendV2):
         self._target = None
         self.sim = None
 
-        if "channels" in self._conf_dict:
-            self._parse_channels(self._conf_dict["channels"])
+    @cached_property
+    def channels_map(self) -> Mapping[str, Mapping]:
+        """Channel objects of each type, keyed by the qubits they operate on.
 
-    def _parse_channels(self, channels: dict) -> None:
-        type_map = {
-            "acquire": pulse.AcquireChannel,
-            "drive": pulse.DriveChannel,
-            "measure": pulse.MeasureChannel,
-            "control": pulse.ControlChannel,
-        }
-        identifier_pattern = re.compile(r"\D+(?P<index>\d+)")
+        The channels are parsed from the configuration on first access, since
+        only pulse-level users need them.
+        """
+        if "channels" not in self._conf_dict:
+            return _NO_CHANNELS
+        return self._parse_channels(self._conf_dict["channels"])
 
+    def _parse_channels(self, channels: dict) -> dict:
         channels_map = {  # type: ignore
             "acquire": collections.defaultdict(list),
             "drive": collections.defaultdict(list),
@@ -113,15 +146,16 @@ class FakeBackendV2(BackendV2):
         }
         for identifier, spec in channels.items():
             channel_type = spec["type"]
-            out = re.match(identifier_pattern, identifier)
-            if out is None:
+            # Identifiers are a channel prefix followed by the index, e.g. ``d0`` or ``u12``.
+            index = identifier.lstrip(ascii_letters)
+            if index == identifier or not index.isdecimal():
                 # Identifier is not a valid channel name format
                 continue
-            channel_index = int(out.groupdict()["index"])
+            channel_index = int(index)
             qubit_index = tuple(spec["operates"]["qubits"])
-            chan_obj = type_map[channel_type](channel_index)
+            chan_obj = _CHANNEL_TYPES[channel_type](channel_index)
             channels_map[channel_type][qubit_index].append(chan_obj)
-        setattr(self, "channels_map", channels_map)
+        return channels_map
 
     def _setup_sim(self) -> None:
         if _optionals.HAS_AER:
@@ -163,11 +197,7 @@ class FakeBackendV2(BackendV2):
         return "qasm3" in supported_features
 
     def _load_json(self, filename: str) -> dict:
-        with open(  # pylint: disable=unspecified-encoding
-            os.path.join(self.dirname, filename)
-        ) as f_json:
-            the_json = json.load(f_json)
-        return the_json
+        return load_json_file(self.dirname, filename)
 
     @property
     def target(self) -> Target:
@@ -176,7 +206,6 @@ class FakeBackendV2(BackendV2):
         :rtype: Target
         """
         if self._target is None:
-            self._get_conf_dict_from_json()
             if self._props_dict is None:
                 self._set_props_dict_from_json()
             if self._defs_dict is None:
@@ -259,7 +288,7 @@ class FakeBackendV2(BackendV2):
         Returns:
             DriveChannel: The Qubit drive channel
         """
-        drive_channels_map = getattr(self, "channels_map", {}).get("drive", {})
+        drive_channels_map = self.channels_map.get("drive", _NO_CHANNELS)
         qubits = (qubit,)
         if qubits in drive_channels_map:
             return drive_channels_map[qubits][0]
@@ -274,7 +303,7 @@ class FakeBackendV2(BackendV2):
         Returns:
             MeasureChannel: The Qubit measurement stimulus line
         """
-        measure_channels_map = getattr(self, "channels_map", {}).get("measure", {})
+        measure_channels_map = self.channels_map.get("measure", _NO_CHANNELS)
         qubits = (qubit,)
         if qubits in measure_channels_map:
             return measure_channels_map[qubits][0]
@@ -289,7 +318,7 @@ class FakeBackendV2(BackendV2):
         Returns:
             AcquireChannel: The Qubit measurement acquisition line.
         """
-        acquire_channels_map = getattr(self, "channels_map", {}).get("acquire", {})
+        acquire_channels_map = self.channels_map.get("acquire", _NO_CHANNELS)
         qubits = (qubit,)
         if qubits in acquire_channels_map:
             return acquire_channels_map[qubits][0]
@@ -311,7 +340,7 @@ class FakeBackendV2(BackendV2):
         Returns:
             List[ControlChannel]: The multi qubit control line.
         """
-        control_channels_map = getattr(self, "channels_map", {}).get("control", {})
+        control_channels_map = self.channels_map.get("control", _NO_CHANNELS)
         qubits = tuple(qubits)
         if qubits in control_channels_map:
             return control_channels_map[qubits]
@@ -10,7 +10,7 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
-# pylint: disable=wildcard-import,unused-argument
+# pylint: disable=unused-argument
 
 """
 Fake provider class that provides access to fake backends.
@@ -20,7 +20,7 @@ from typing import Any, List
 from qiskit.providers.provider import ProviderV1
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 
-from .backends import *
+from . import backends
 from .fake_backend import FakeBackendV2
 from ..utils.deprecation import issue_deprecation_msg, deprecate_function
 
@@ -97,63 +97,63 @@ class FakeProviderForBackendV2:
 
     def __init__(self) -> None:
         self._backends = [
-            FakeAlgiers(),  # type: ignore
-            FakeAlmadenV2(),  # type: ignore
-            FakeArmonkV2(),  # type: ignore
-            FakeAthensV2(),  # type: ignore
-            FakeAuckland(),  # type: ignore
-            FakeBelemV2(),  # type: ignore
-            FakeBoeblingenV2(),  # type: ignore
-            FakeBogotaV2(),  # type: ignore
-            FakeBrisbane(),  # type: ignore
-            FakeBrooklynV2(),  # type: ignore
-            FakeBurlingtonV2(),  # type: ignore
-            FakeCairoV2(),  # type: ignore
-            FakeCambridgeV2(),  # type: ignore
-            FakeCasablancaV2(),  # type: ignore
-            FakeCusco(),  # type: ignore
-            FakeEssexV2(),  # type: ignore
-            FakeFractionalBackend(),  # type: ignore
-            FakeGeneva(),  # type: ignore
-            FakeGuadalupeV2(),  # type: ignore
-            FakeHanoiV2(),  # type: ignore
-            FakeJakartaV2(),  # type: ignore
-            FakeJohannesburgV2(),  # type: ignore
-            FakeKawasaki(),  # type: ignore
-            FakeKolkataV2(),  # type: ignore
-            FakeKyiv(),  # type: ignore
-            FakeKyoto(),  # type: ignore
-            FakeLagosV2(),  # type: ignore
-            FakeLimaV2(),  # type: ignore
-            FakeLondonV2(),  # type: ignore
-            FakeManhattanV2(),  # type: ignore
-            FakeManilaV2(),  # type: ignore
-            FakeMelbourneV2(),  # type: ignore
-            FakeMontrealV2(),  # type: ignore
-            FakeMumbaiV2(),  # type: ignore
-            FakeNairobiV2(),  # type: ignore
-            FakeOsaka(),  # type: ignore
-            FakeOslo(),  # type: ignore
-            FakeOurenseV2(),  # type: ignore
-            FakeParisV2(),  # type: ignore
-            FakePeekskill(),  # type: ignore
-            FakePerth(),  # type: ignore
-            FakePrague(),  # type: ignore
-            FakePoughkeepsieV2(),  # type: ignore
-            FakeQuebec(),  # type: ignore
-            FakeQuitoV2(),  # type: ignore
-            FakeRochesterV2(),  # type: ignore
-            FakeRomeV2(),  # type: ignore
-            FakeSantiagoV2(),  # type: ignore
-            FakeSherbrooke(),  # type: ignore
-            FakeSingaporeV2(),  # type: ignore
-            FakeSydneyV2(),  # type: ignore
-            FakeTorino(),  # type: ignore
-            FakeTorontoV2(),  # type: ignore
-            FakeValenciaV2(),  # type: ignore
-            FakeVigoV2(),  # type: ignore
-            FakeWashingtonV2(),  # type: ignore
-            FakeYorktownV2(),  # type: ignore
+            backends.FakeAlgiers(),  # type: ignore
+            backends.FakeAlmadenV2(),  # type: ignore
+            backends.FakeArmonkV2(),  # type: ignore
+            backends.FakeAthensV2(),  # type: ignore
+            backends.FakeAuckland(),  # type: ignore
+            backends.FakeBelemV2(),  # type: ignore
+            backends.FakeBoeblingenV2(),  # type: ignore
+            backends.FakeBogotaV2(),  # type: ignore
+            backends.FakeBrisbane(),  # type: ignore
+            backends.FakeBrooklynV2(),  # type: ignore
+            backends.FakeBurlingtonV2(),  # type: ignore
+            backends.FakeCairoV2(),  # type: ignore
+            backends.FakeCambridgeV2(),  # type: ignore
+            backends.FakeCasablancaV2(),  # type: ignore
+            backends.FakeCusco(),  # type: ignore
+            backends.FakeEssexV2(),  # type: ignore
+            backends.FakeFractionalBackend(),  # type: ignore
+            backends.FakeGeneva(),  # type: ignore
+            backends.FakeGuadalupeV2(),  # type: ignore
+            backends.FakeHanoiV2(),  # type: ignore
+            backends.FakeJakartaV2(),  # type: ignore
+            backends.FakeJohannesburgV2(),  # type: ignore
+            backends.FakeKawasaki(),  # type: ignore
+            backends.FakeKolkataV2(),  # type: ignore
+            backends.FakeKyiv(),  # type: ignore
+            backends.FakeKyoto(),  # type: ignore
+            backends.FakeLagosV2(),  # type: ignore
+            backends.FakeLimaV2(),  # type: ignore
+            backends.FakeLondonV2(),  # type: ignore
+            backends.FakeManhattanV2(),  # type: ignore
+            backends.FakeManilaV2(),  # type: ignore
+            backends.FakeMelbourneV2(),  # type: ignore
+            backends.FakeMontrealV2(),  # type: ignore
+            backends.FakeMumbaiV2(),  # type: ignore
+            backends.FakeNairobiV2(),  # type: ignore
+            backends.FakeOsaka(),  # type: ignore
+            backends.FakeOslo(),  # type: ignore
+            backends.FakeOurenseV2(),  # type: ignore
+            backends.FakeParisV2(),  # type: ignore
+            backends.FakePeekskill(),  # type: ignore
+            backends.FakePerth(),  # type: ignore
+            backends.FakePrague(),  # type: ignore
+            backends.FakePoughkeepsieV2(),  # type: ignore
+            backends.FakeQuebec(),  # type: ignore
+            backends.FakeQuitoV2(),  # type: ignore
+            backends.FakeRochesterV2(),  # type: ignore
+            backends.FakeRomeV2(),  # type: ignore
+            backends.FakeSantiagoV2(),  # type: ignore
+            backends.FakeSherbrooke(),  # type: ignore
+            backends.FakeSingaporeV2(),  # type: ignore
+            backends.FakeSydneyV2(),  # type: ignore
+            backends.FakeTorino(),  # type: ignore
+            backends.FakeTorontoV2(),  # type: ignore
+            backends.FakeValenciaV2(),  # type: ignore
+            backends.FakeVigoV2(),  # type: ignore
+            backends.FakeWashingtonV2(),  # type: ignore
+            backends.FakeYorktownV2(),  # type: ignore
         ]
 
         super().__init__()
@@ -187,50 +187,50 @@ class FakeProvider(ProviderV1):
             "Please use FakeProviderForBackendV2() instead.",
         )
         self._backends = [
-            FakeAlmaden(),  # type: ignore
-            FakeArmonk(),  # type: ignore
-            FakeAthens(),  # type: ignore
-            FakeBelem(),  # type: ignore
-            FakeBoeblingen(),  # type: ignore
-            FakeBogota(),  # type: ignore
-            FakeBrooklyn(),  # type: ignore
-            FakeBurlington(),  # type: ignore
-            FakeCairo(),  # type: ignore
-            FakeCambridge(),  # type: ignore
-            FakeCambridgeAlternativeBasis(),  # type: ignore
-            FakeCasablanca(),  # type: ignore
-            FakeEssex(),  # type: ignore
-            FakeGuadalupe(),  # type: ignore
-            FakeHanoi(),  # type: ignore
-            FakeJakarta(),  # type: ignore
-            FakeJohannesburg(),  # type: ignore
-            FakeKolkata(),  # type: ignore
-            FakeLagos(),  # type: ignore
-            FakeLima(),  # type: ignore
-            FakeLondon(),  # type: ignore
-            FakeManila(),  # type: ignore
-            FakeManhattan(),  # type: ignore
-            FakeMelbourne(),  # type: ignore
-            FakeMontreal(),  # type: ignore
-            FakeMumbai(),  # type: ignore
-            FakeNairobi(),  # type: ignore
-            FakeOurense(),  # type: ignore
-            FakeParis(),  # type: ignore
-            FakePoughkeepsie(),  # type: ignore
-            FakeQuito(),  # type: ignore
-            FakeRochester(),  # type: ignore
-            FakeRome(),  # type: ignore
-            FakeRueschlikon(),  # type: ignore
-            FakeSantiago(),  # type: ignore
-            FakeSingapore(),  # type: ignore
-            FakeSydney(),  # type: ignore
-            FakeTenerife(),  # type: ignore
-            FakeTokyo(),  # type: ignore
-            FakeToronto(),  # type: ignore
-            FakeValencia(),  # type: ignore
-            FakeVigo(),  # type: ignore
-            FakeWashington(),  # type: ignore
-            FakeYorktown(),  # type: ignore
+            backends.FakeAlmaden(),  # type: ignore
+            backends.FakeArmonk(),  # type: ignore
+            backends.FakeAthens(),  # type: ignore
+            backends.FakeBelem(),  # type: ignore
+            backends.FakeBoeblingen(),  # type: ignore
+            backends.FakeBogota(),  # type: ignore
+            backends.FakeBrooklyn(),  # type: ignore
+            backends.FakeBurlington(),  # type: ignore
+            backends.FakeCairo(),  # type: ignore
+            backends.FakeCambridge(),  # type: ignore
+            backends.FakeCambridgeAlternativeBasis(),  # type: ignore
+            backends.FakeCasablanca(),  # type: ignore
+            backends.FakeEssex(),  # type: ignore
+            backends.FakeGuadalupe(),  # type: ignore
+            backends.FakeHanoi(),  # type: ignore
+            backends.FakeJakarta(),  # type: ignore
+            backends.FakeJohannesburg(),  # type: ignore
+            backends.FakeKolkata(),  # type: ignore
+            backends.FakeLagos(),  # type: ignore
+            backends.FakeLima(),  # type: ignore
+            backends.FakeLondon(),  # type: ignore
+            backends.FakeManila(),  # type: ignore
+            backends.FakeManhattan(),  # type: ignore
+            backends.FakeMelbourne(),  # type: ignore
+            backends.FakeMontreal(),  # type: ignore
+            backends.FakeMumbai(),  # type: ignore
+            backends.FakeNairobi(),  # type: ignore
+            backends.FakeOurense(),  # type: ignore
+            backends.FakeParis(),  # type: ignore
+            backends.FakePoughkeepsie(),  # type: ignore
+            backends.FakeQuito(),  # type: ignore
+            backends.FakeRochester(),  # type: ignore
+            backends.FakeRome(),  # type: ignore
+            backends.FakeRueschlikon(),  # type: ignore
+            backends.FakeSantiago(),  # type: ignore
+            backends.FakeSingapore(),  # type: ignore
+            backends.FakeSydney(),  # type: ignore
+            backends.FakeTenerife(),  # type: ignore
+            backends.FakeTokyo(),  # type: ignore
+            backends.FakeToronto(),  # type: ignore
+            backends.FakeValencia(),  # type: ignore
+            backends.FakeVigo(),  # type: ignore
+            backends.FakeWashington(),  # type: ignore
+            backends.FakeYorktown(),  # type: ignore
         ]
 
         super().__init__()
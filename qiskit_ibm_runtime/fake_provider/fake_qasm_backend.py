@@ -14,9 +14,6 @@
 Fake backend abstract class for mock backends.
 """
 
-import json
-import os
-
 from qiskit.exceptions import QiskitError
 from qiskit.providers.models import BackendProperties, QasmBackendConfiguration
 
@@ -24,7 +21,7 @@ from qiskit.providers.fake_provider.utils.json_decoder import (
     decode_backend_configuration,
     decode_backend_properties,
 )
-from .fake_backend import FakeBackend
+from .fake_backend import FakeBackend, load_json_file
 
 
 class FakeQasmBackend(FakeBackend):
@@ -64,11 +61,7 @@ class FakeQasmBackend(FakeBackend):
         self._properties = BackendProperties.from_dict(props)
 
     def _load_json(self, filename: str) -> dict:
-        with open(  # pylint: disable=unspecified-encoding
-            os.path.join(self.dirname, filename)
-        ) as f_json:
-            the_json = json.load(f_json)
-        return the_json
+        return load_json_file(self.dirname, filename)
 
     def _get_config_from_dict(self, conf: dict) -> QasmBackendConfiguration:
         return QasmBackendConfiguration.from_dict(conf)
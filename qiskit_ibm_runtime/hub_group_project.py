@@ -101,3 +101,6 @@ class HubGroupProject:
         if not isinstance(other, HubGroupProject):
             return False
         return self.name == other.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
@@ -50,7 +50,7 @@ from .runtime_job import RuntimeJob
 
 from .api.clients import RuntimeClient
 from .exceptions import IBMBackendApiProtocolError, IBMBackendValueError, IBMBackendApiError
-from .utils.backend_converter import convert_to_target
+from .utils.backend_converter import _MISSING, convert_to_target
 from .utils.default_session import get_cm_session as get_cm_primitive_session
 from .utils.backend_decoder import (
     defaults_from_server_data,
@@ -200,13 +200,12 @@ class IBMBackend(Backend):
         ):
             self.options.set_validator("noise_model", type(None))
             self.options.set_validator("seed_simulator", type(None))
-        if hasattr(configuration, "max_shots"):
-            self.options.set_validator("shots", (1, configuration.max_shots))
-        if hasattr(configuration, "rep_delay_range"):
-            self.options.set_validator(
-                "rep_delay",
-                (configuration.rep_delay_range[0], configuration.rep_delay_range[1]),
-            )
+        max_shots = getattr(configuration, "max_shots", _MISSING)
+        if max_shots is not _MISSING:
+            self.options.set_validator("shots", (1, max_shots))
+        rep_delay_range = getattr(configuration, "rep_delay_range", _MISSING)
+        if rep_delay_range is not _MISSING:
+            self.options.set_validator("rep_delay", (rep_delay_range[0], rep_delay_range[1]))
 
     def __getattr__(self, name: str) -> Any:
         """Gets attribute from self or configuration
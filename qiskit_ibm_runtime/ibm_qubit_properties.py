@@ -18,13 +18,8 @@ from qiskit.providers.backend import QubitProperties
 class IBMQubitProperties(QubitProperties):
     """A representation of the properties of a qubit on an IBM backend."""
 
-    __slots__ = (  # pylint: disable=redefined-slots-in-subclass
-        "t1",
-        "t2",
-        "frequency",
-        "anharmonicity",
-        "operational",
-    )
+    # ``t1``, ``t2`` and ``frequency`` are slots of ``QubitProperties`` already.
+    __slots__ = ("anharmonicity", "operational")
 
     def __init__(  # type: ignore[no-untyped-def]
         self,
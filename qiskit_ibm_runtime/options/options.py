@@ -318,10 +318,9 @@ class Options(BaseOptions):
     def __post_init__(self):  # type: ignore
         """Convert dictionary fields to object."""
         obj_fields = getattr(self, "_obj_fields", {})
-        for key in list(obj_fields):
-            if hasattr(self, key):
-                orig_val = getattr(self, key)
-                setattr(self, key, _to_obj(obj_fields[key], orig_val))
+        orig_vals = {key: val for key, val in vars(self).items() if key in obj_fields}
+        for key, orig_val in orig_vals.items():
+            setattr(self, key, _to_obj(obj_fields[key], orig_val))
 
     @staticmethod
     def _get_program_inputs(options: dict) -> dict:
@@ -1190,6 +1190,10 @@ class QiskitRuntimeService:
         return "<{}>".format(self.__class__.__name__)
 
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, QiskitRuntimeService):
+            return False
         return (
             self._channel == other._channel
             and self._account.instance == other._account.instance
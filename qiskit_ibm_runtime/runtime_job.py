@@ -163,7 +163,7 @@ class RuntimeJob(Job, BaseRuntimeJob):
             raise RuntimeJobFailureError(f"Unable to retrieve job result. {error_message}")
         if self._status is JobStatus.CANCELLED:
             raise RuntimeInvalidStateError(
-                "Unable to retrieve result for job {}. " "Job was cancelled.".format(self.job_id())
+                f"Unable to retrieve result for job {self.job_id()}. Job was cancelled."
             )
 
         result_raw = self._download_external_result(
@@ -187,6 +187,7 @@ class RuntimeJob(Job, BaseRuntimeJob):
             raise IBMRuntimeError(f"Failed to cancel job: {ex}") from None
         self.cancel_result_streaming()
         self._status = JobStatus.CANCELLED
+        self._job_response = None
 
     def status(self) -> JobStatus:
         """Return the status of the job.
@@ -331,7 +332,7 @@ class RuntimeJob(Job, BaseRuntimeJob):
             RuntimeJobTimeoutError: If the job does not complete within given timeout.
         """
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             if self._status not in self.JOB_FINAL_STATES and not self._is_streaming():
                 self._ws_client_future = self._executor.submit(self._start_websocket_client)
             if self._is_streaming():
@@ -340,7 +341,7 @@ class RuntimeJob(Job, BaseRuntimeJob):
             # because status doesn't become final as soon as stream closes
             status = self.status()
             while status not in self.JOB_FINAL_STATES:
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 if timeout is not None and elapsed_time >= timeout:
                     raise RuntimeJobTimeoutError(
                         f"Timed out waiting for job to complete after {timeout} secs."
@@ -361,7 +362,7 @@ class RuntimeJob(Job, BaseRuntimeJob):
         if not self._backend:  # type: ignore
             self.wait_for_final_state(timeout=timeout)
             try:
-                raw_data = self._api_client.job_get(self.job_id())
+                raw_data = self._get_job_response()
                 if raw_data.get("backend"):
                     self._backend = self._service.backend(raw_data["backend"])
             except RequestsApiError as err:
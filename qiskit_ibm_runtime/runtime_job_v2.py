@@ -39,6 +39,10 @@ from .base_runtime_job import BaseRuntimeJob
 
 logger = logging.getLogger(__name__)
 
+# Bounds, in seconds, of the delay between status requests while waiting for a job.
+_POLL_MIN_DELAY = 0.1
+_POLL_MAX_DELAY = 5.0
+
 JobStatus = Literal["INITIALIZING", "QUEUED", "RUNNING", "CANCELLED", "DONE", "ERROR"]
 API_TO_JOB_STATUS: Dict[str, JobStatus] = {
     "QUEUED": "QUEUED",
@@ -140,7 +144,7 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
             raise RuntimeJobFailureError(f"Unable to retrieve job result. {error_message}")
         if self._status == "CANCELLED":
             raise RuntimeInvalidStateError(
-                "Unable to retrieve result for job {}. " "Job was cancelled.".format(self.job_id())
+                f"Unable to retrieve result for job {self.job_id()}. Job was cancelled."
             )
 
         result_raw = self._download_external_result(
@@ -164,6 +168,7 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
             raise IBMRuntimeError(f"Failed to cancel job: {ex}") from None
         self.cancel_result_streaming()
         self._status = "CANCELLED"
+        self._job_response = None
 
     def status(self) -> JobStatus:
         """Return the status of the job.
@@ -184,12 +189,10 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
             Job status.
         """
         api_status = response["state"]["status"].upper()
-        if api_status in API_TO_JOB_STATUS:
-            mapped_job_status = API_TO_JOB_STATUS[api_status]
-            if mapped_job_status == "CANCELLED" and self._reason == "RAN TOO LONG":
-                mapped_job_status = "ERROR"
-            return mapped_job_status
-        return api_status
+        mapped_job_status = API_TO_JOB_STATUS.get(api_status, api_status)
+        if mapped_job_status == "CANCELLED" and self._reason == "RAN TOO LONG":
+            return "ERROR"
+        return mapped_job_status
 
     def cancelled(self) -> bool:
         """Return whether the job has been cancelled."""
@@ -248,7 +251,7 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
             RuntimeJobTimeoutError: If the job does not complete within given timeout.
         """
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             if self._status not in self.JOB_FINAL_STATES and not self._is_streaming():
                 self._ws_client_future = self._executor.submit(self._start_websocket_client)
             if self._is_streaming():
@@ -256,14 +259,23 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
             # poll for status after stream has closed until status is final
             # because status doesn't become final as soon as stream closes
             status = self.status()
+            delay = _POLL_MIN_DELAY
             while status not in self.JOB_FINAL_STATES:
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 if timeout is not None and elapsed_time >= timeout:
                     raise RuntimeJobTimeoutError(
                         f"Timed out waiting for job to complete after {timeout} secs."
                     )
-                time.sleep(0.1)
-                status = self.status()
+                if timeout is not None:
+                    delay = min(delay, timeout - elapsed_time)
+                time.sleep(delay)
+                previous_status, status = status, self.status()
+                # Back off while nothing changes, but poll quickly again after a
+                # transition since the job is then likely to finish soon.
+                if status == previous_status:
+                    delay = min(delay * 1.5, _POLL_MAX_DELAY)
+                else:
+                    delay = _POLL_MIN_DELAY
         except futures.TimeoutError:
             raise RuntimeJobTimeoutError(
                 f"Timed out waiting for job to complete after {timeout} secs."
@@ -278,7 +290,7 @@ class RuntimeJobV2(BasePrimitiveJob[PrimitiveResult, JobStatus], BaseRuntimeJob)
         if not self._backend:  # type: ignore
             self.wait_for_final_state(timeout=timeout)
             try:
-                raw_data = self._api_client.job_get(self.job_id())
+                raw_data = self._get_job_response()
                 if raw_data.get("backend"):
                     self._backend = self._service.backend(raw_data["backend"])
             except RequestsApiError as err:
@@ -43,6 +43,9 @@ from qiskit.transpiler.target import InstructionProperties, Target
 
 logger = logging.getLogger(__name__)
 
+# Marks configuration fields that are not defined.
+_MISSING = object()
+
 
 def convert_to_target(
     configuration: BackendConfiguration,
@@ -86,10 +89,12 @@ def convert_to_target(
     in_data = {"num_qubits": configuration.n_qubits}
 
     # Parse global configuration properties
-    if hasattr(configuration, "dt"):
-        in_data["dt"] = configuration.dt
-    if hasattr(configuration, "timing_constraints"):
-        in_data.update(configuration.timing_constraints)
+    dt = getattr(configuration, "dt", _MISSING)
+    if dt is not _MISSING:
+        in_data["dt"] = dt
+    timing_constraints = getattr(configuration, "timing_constraints", _MISSING)
+    if timing_constraints is not _MISSING:
+        in_data.update(timing_constraints)
 
     # Create instruction property placeholder from backend configuration
     basis_gates = set(getattr(configuration, "basis_gates", []))
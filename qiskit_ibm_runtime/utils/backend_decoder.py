@@ -12,6 +12,7 @@
 
 """Utilities for working with IBM Quantum backends."""
 
+from functools import lru_cache
 from typing import List, Dict, Union, Optional
 import logging
 import traceback
@@ -96,15 +97,18 @@ def properties_from_server_data(properties: Dict) -> BackendProperties:
         A ``BackendProperties`` instance.
     """
     if isinstance(properties["last_update_date"], str):
-        properties["last_update_date"] = dateutil.parser.isoparse(properties["last_update_date"])
+        # Most entries share a handful of calibration timestamps, so each distinct
+        # string is parsed once. ``datetime`` objects are immutable and safe to share.
+        isoparse = lru_cache(maxsize=None)(dateutil.parser.isoparse)
+        properties["last_update_date"] = isoparse(properties["last_update_date"])
         for qubit in properties["qubits"]:
             for nduv in qubit:
-                nduv["date"] = dateutil.parser.isoparse(nduv["date"])
+                nduv["date"] = isoparse(nduv["date"])
         for gate in properties["gates"]:
             for param in gate["parameters"]:
-                param["date"] = dateutil.parser.isoparse(param["date"])
+                param["date"] = isoparse(param["date"])
         for gen in properties["general"]:
-            gen["date"] = dateutil.parser.isoparse(gen["date"])
+            gen["date"] = isoparse(gen["date"])
 
     properties = utc_to_local_all(properties)
     return BackendProperties.from_dict(properties)
@@ -151,9 +155,12 @@ def _decode_pulse_library_item(pulse_library_item: Dict) -> None:
     Args:
         pulse_library_item: A ``PulseLibraryItem`` in dictionary format.
     """
-    pulse_library_item["samples"] = [
-        _to_complex(sample) for sample in pulse_library_item["samples"]
-    ]
+    samples = pulse_library_item["samples"]
+    try:
+        # Samples are normally ``[real, imag]`` pairs, which can be unpacked directly.
+        pulse_library_item["samples"] = [complex(real, imag) for real, imag in samples]
+    except (TypeError, ValueError):
+        pulse_library_item["samples"] = [_to_complex(sample) for sample in samples]
 
 
 def _decode_pulse_qobj_instr(pulse_qobj_instr: Dict) -> None:
@@ -20,6 +20,7 @@ import importlib
 import inspect
 import io
 import json
+import math
 import re
 import warnings
 import zlib
@@ -44,6 +45,13 @@ try:
 except ImportError:
     HAS_AER = False
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from qiskit.circuit import (
     Instruction,
     Parameter,
@@ -315,6 +323,65 @@ class RuntimeEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if HAS_ORJSON else 0
+)
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return whether ``obj`` holds a NaN or infinite float outside of encoded objects."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(val) for val in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(val) for val in obj)
+    return False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """``default`` hook used when serializing with ``orjson``.
+
+    ``orjson`` does not serialize ``float`` subclasses (e.g. ``numpy.float64``), which the
+    standard library encoder treats as plain floats. Everything else is delegated to
+    :meth:`RuntimeEncoder.default` so both encoders produce the same document.
+
+    Raises:
+        TypeError: If the encoded value holds a non-finite float, which ``orjson``
+            would write as ``null``.
+    """
+    value = float(obj) if isinstance(obj, float) else RuntimeEncoder().default(obj)
+    if _has_non_finite(value):
+        raise TypeError("orjson cannot encode non-finite floats")
+    return value
+
+
+def runtime_dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to UTF-8 encoded JSON using the runtime encoding.
+
+    ``orjson`` is used when it is installed. Objects that ``orjson`` cannot represent,
+    such as non-string dictionary keys, integers larger than 64 bits or NaN and
+    infinite floats, fall back to :class:`RuntimeEncoder`.
+
+    Args:
+        obj: Object to serialize.
+
+    Returns:
+        The serialized JSON document, ready to be sent as a request body.
+    """
+    if HAS_ORJSON:
+        try:
+            encoded = orjson.dumps(obj, default=_orjson_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # ``orjson`` writes non-finite floats as ``null``, so only payloads that
+            # contain a ``null`` need to be checked for them.
+            if b"null" not in encoded or not _has_non_finite(obj):
+                return encoded
+    return json.dumps(obj, cls=RuntimeEncoder).encode("utf-8")
+
+
 class RuntimeDecoder(json.JSONDecoder):
     """JSON Decoder used by runtime service."""
 
@@ -83,6 +83,14 @@ class ClientErrorHandler(BaseHandler):
         return 400
 
 
+class EchoPathHandler(BaseHandler):
+    """Request handler that returns the requested path."""
+
+    def _get_response_data(self):
+        """Return the request path."""
+        return {"path": self.path}
+
+
 class SimpleServer:
     """A simple test HTTP server."""
 
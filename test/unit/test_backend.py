@@ -28,6 +28,7 @@ from qiskit_ibm_runtime import SamplerV2
 from qiskit_ibm_runtime.fake_provider import FakeManila, FakeSherbrooke, FakeFractionalBackend
 from qiskit_ibm_runtime.ibm_backend import IBMBackend
 from qiskit_ibm_runtime.utils.backend_converter import convert_to_target
+from qiskit_ibm_runtime.utils.backend_decoder import defaults_from_server_data
 
 from ..ibm_test_case import IBMTestCase
 from ..utils import create_faulty_backend
@@ -378,3 +379,15 @@ class TestBackend(IBMTestCase):
             "while_loop" in target.operation_names,
             use_dynamic,
         )
+
+    def test_defaults_from_server_data(self):
+        """Test pulse library samples are decoded to complex values."""
+        defaults = FakeManila().defaults().to_dict()
+        raw_defaults = copy.deepcopy(defaults)
+        for item in raw_defaults["pulse_library"]:
+            item["samples"] = [[sample.real, sample.imag] for sample in item["samples"]]
+        # Already decoded samples are kept as is.
+        raw_defaults["pulse_library"][0]["samples"] = defaults["pulse_library"][0]["samples"]
+
+        decoded = defaults_from_server_data(raw_defaults)
+        self.assertEqual(decoded.to_dict()["pulse_library"], defaults["pulse_library"])
@@ -12,12 +12,14 @@
 
 """Tests for runtime data serialization."""
 
+import itertools
 import json
 import os
 import subprocess
 import tempfile
 import warnings
 from datetime import datetime
+from unittest.mock import patch
 
 import numpy as np
 from ddt import data, ddt
@@ -41,6 +43,7 @@ from qiskit.primitives.containers import (
 )
 from qiskit_aer.noise import NoiseModel
 from qiskit_ibm_runtime.utils import RuntimeEncoder, RuntimeDecoder
+from qiskit_ibm_runtime.utils.json import HAS_ORJSON, runtime_dumps
 from qiskit_ibm_runtime.fake_provider import FakeNairobi
 
 from .mock.fake_runtime_client import CustomResultRuntimeJob
@@ -92,6 +95,43 @@ class TestDataSerialization(IBMTestCase):
         self.assertIsInstance(decoded_result, Result)
         self.assertTrue((decoded_array == orig_array).all())
 
+    def test_runtime_dumps(self):
+        """Test runtime_dumps produces the same document as RuntimeEncoder."""
+        subtests = (
+            {"string": "foo", "float": np.float64(1.5), "int": np.int64(3)},
+            {"complex": 2 + 3j, "set": {1, 2}, "datetime": datetime(2021, 8, 4)},
+            {"array": np.array([[1, 2, 3], [4, 5, 6]])},
+            {"int_keys": {1: "a", 2: "b"}},
+        )
+        for has_orjson, obj in itertools.product([True, False], subtests):
+            with self.subTest(has_orjson=has_orjson, obj=obj), patch(
+                "qiskit_ibm_runtime.utils.json.HAS_ORJSON", has_orjson and HAS_ORJSON
+            ):
+                encoded = runtime_dumps(obj)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(
+                    json.loads(encoded), json.loads(json.dumps(obj, cls=RuntimeEncoder))
+                )
+
+    def test_runtime_dumps_non_finite(self):
+        """Test runtime_dumps keeps NaN and infinite floats."""
+        subtests = (
+            {"x": float("nan")},
+            {"x": [1.0, float("inf")]},
+            {"x": np.float64("-inf")},
+            {"x": complex(float("nan"), 1)},
+            {"x": np.array([np.nan, 1.0])},
+        )
+        for has_orjson, obj in itertools.product([True, False], subtests):
+            with self.subTest(has_orjson=has_orjson, obj=obj), patch(
+                "qiskit_ibm_runtime.utils.json.HAS_ORJSON", has_orjson and HAS_ORJSON
+            ):
+                # Re-serializing writes NaN and infinity as literals, unlike null.
+                self.assertEqual(
+                    json.dumps(json.loads(runtime_dumps(obj))),
+                    json.dumps(json.loads(json.dumps(obj, cls=RuntimeEncoder))),
+                )
+
     def test_coder_qc(self):
         """Test runtime encoder and decoder for circuits."""
         bell_circuit = bell()
@@ -54,27 +54,65 @@ class TestPrimitivesV2(IBMTestCase):
     def setUpClass(cls):
         cls.circ = bell()
         cls.obs = SparsePauliOp.from_list([("IZ", 1)])
+
+        # Transpiling dominates the run time of these tests, so each circuit
+        # is transpiled once here. Tests that modify a circuit take a copy.
+        backend = get_mocked_backend()
+        cls.isa_empty_2q, cls.isa_real_amp_2q, cls.isa_real_amp_3q = transpile(
+            [
+                QuantumCircuit(2),
+                RealAmplitudes(num_qubits=2, reps=1),
+                RealAmplitudes(num_qubits=3, reps=1),
+            ],
+            backend=backend,
+        )
+
+        cls.fake_manila = fake_backend = FakeManila()
+        num_qubits = fake_backend.configuration().num_qubits
+        x_1q = QuantumCircuit(1, 1)
+        x_1q.x(0)
+        x_all = QuantumCircuit(num_qubits, num_qubits)
+        for i in range(num_qubits):
+            x_all.x(i)
+        cx_chain = QuantumCircuit(num_qubits, num_qubits)
+        for i in range(num_qubits - 2):
+            cx_chain.cx(i, i + 1)
+        cls.manila_x_1q, cls.manila_x_all, cls.manila_cx_chain = transpile(
+            [x_1q, x_all, cx_chain], backend=fake_backend
+        )
+        x_2q = QuantumCircuit(2, 2)
+        for i in range(2):
+            x_2q.x(i)
+        cls.manila_x_2q = transpile(x_2q, backend=fake_backend, initial_layout=[0, 1])
+        cx_2q = QuantumCircuit(2, 2)
+        cx_2q.cx(0, 1)
+        cls.manila_cx_2q = transpile(
+            cx_2q,
+            backend=fake_backend,
+            initial_layout=fake_backend.configuration().coupling_map[0],
+        )
         return super().setUpClass()
 
     def tearDown(self) -> None:
         super().tearDown()
         _DEFAULT_SESSION.set(None)
 
-    @data(EstimatorV2, SamplerV2)
-    def test_dict_options(self, primitive):
-        """Test passing a dictionary as options."""
-        options_vars = [
+    @combine(
+        primitive=[EstimatorV2, SamplerV2],
+        options=[
             {},
             {
                 "max_execution_time": 100,
                 "execution": {"init_qubits": True},
             },
             {"default_shots": 1000},
-        ]
+        ],
+    )
+    def test_dict_options(self, primitive, options):
+        """Test passing a dictionary as options."""
         backend = get_mocked_backend()
-        for options in options_vars:
-            inst = primitive(backend=backend, options=options)
-            self.assertTrue(dict_paritally_equal(asdict(inst.options), options))
+        inst = primitive(backend=backend, options=options)
+        self.assertTrue(dict_paritally_equal(asdict(inst.options), options))
 
     @combine(
         primitive=[EstimatorV2, SamplerV2],
@@ -101,7 +139,7 @@ class TestPrimitivesV2(IBMTestCase):
         backend = get_mocked_backend()
         options = primitive._options_class(environment=env_var)
         inst = primitive(backend=backend, options=options)
-        inst.run(**get_primitive_inputs(inst, backend=backend))
+        inst.run(**get_primitive_inputs(inst))
         run_options = backend.service.run.call_args.kwargs["options"]
         for key, val in env_var.items():
             self.assertEqual(run_options[key], val)
@@ -119,8 +157,9 @@ class TestPrimitivesV2(IBMTestCase):
         options = primitive._options_class(**opts)
         inst = primitive(backend=backend, options=options)
         inst.run(**get_primitive_inputs(inst))
-        run_options = backend.service.run.call_args.kwargs["options"]
-        input_params = backend.service.run.call_args.kwargs["inputs"]
+        run_kwargs = backend.service.run.call_args.kwargs
+        run_options = run_kwargs["options"]
+        input_params = run_kwargs["inputs"]
         expected = list(opts.values())[0]
         for key, val in expected.items():
             self.assertEqual(run_options[key], val)
@@ -136,7 +175,10 @@ class TestPrimitivesV2(IBMTestCase):
         options.max_execution_time = 100
         inst = primitive(backend=backend, options=options)
         options.max_execution_time = 200
+        options.environment.log_level = "DEBUG"
+        self.assertIsNot(inst.options, options)
         self.assertEqual(inst.options.max_execution_time, 100)
+        self.assertEqual(inst.options.environment.log_level, "WARNING")
 
     @data(EstimatorV2, SamplerV2)
     def test_init_with_backend_str(self, primitive):
@@ -257,7 +299,7 @@ class TestPrimitivesV2(IBMTestCase):
 
         inst = primitive(mode=session)
         self.assertIsNotNone(inst.mode)
-        inst.run(**get_primitive_inputs(inst, backend=backend))
+        inst.run(**get_primitive_inputs(inst))
         self.assertEqual(inst.mode, session)
         session.run.assert_called_once()
         self.assertEqual(session._backend, backend)
@@ -272,17 +314,14 @@ class TestPrimitivesV2(IBMTestCase):
 
         inst = primitive(mode=batch)
         self.assertIsNotNone(inst.mode)
-        inst.run(**get_primitive_inputs(inst, backend=backend))
+        inst.run(**get_primitive_inputs(inst))
         batch.run.assert_called_once()
         self.assertEqual(batch._backend, backend)
 
     @data(EstimatorV2, SamplerV2)
     def test_parameters_single_circuit(self, primitive):
         """Test parameters for a single cirucit."""
-
-        circ = RealAmplitudes(num_qubits=2, reps=1)
-        backend = get_mocked_backend()
-        circ = transpile(circ, backend=backend)
+        circ = self.isa_real_amp_2q
 
         param_vals = [
             # 1 set of parameter values
@@ -312,10 +351,8 @@ class TestPrimitivesV2(IBMTestCase):
     @data(EstimatorV2, SamplerV2)
     def test_nd_parameters(self, primitive):
         """Test with parameters of different dimensions."""
-        circ = RealAmplitudes(num_qubits=2, reps=1)
-        backend = get_mocked_backend()
-        circ = transpile(circ, backend=backend)
-        inst = primitive(backend=backend)
+        circ = self.isa_real_amp_2q
+        inst = primitive(backend=get_mocked_backend())
 
         with self.subTest("0-d"):
             param_vals = np.linspace(0, 1, 4)
@@ -332,11 +369,7 @@ class TestPrimitivesV2(IBMTestCase):
     def test_parameters_multiple_circuits(self, primitive):
         """Test multiple parameters for multiple circuits."""
         backend = get_mocked_backend()
-        circuits = [
-            transpile(QuantumCircuit(2), backend=backend),
-            transpile(RealAmplitudes(num_qubits=2, reps=1), backend=backend),
-            transpile(RealAmplitudes(num_qubits=3, reps=1), backend=backend),
-        ]
+        circuits = [self.isa_empty_2q, self.isa_real_amp_2q, self.isa_real_amp_3q]
 
         param_vals = [
             (
@@ -364,48 +397,41 @@ class TestPrimitivesV2(IBMTestCase):
                     pubs.append(publet)
                 inst.run(pubs)
 
-    @data(EstimatorV2, SamplerV2)
-    def test_run_updated_options(self, primitive):
+    @combine(
+        primitive=[EstimatorV2, SamplerV2],
+        options=[
+            {"dynamical_decoupling": {"sequence_type": "XY4"}},
+            {"default_shots": 2000},
+            {"execution": {"init_qubits": True}},
+        ],
+    )
+    def test_run_updated_options(self, primitive, options):
         """Test run using overwritten options."""
         backend = get_mocked_backend()
-        options_vars = [
-            (
-                {"dynamical_decoupling": {"sequence_type": "XY4"}},
-                {"dynamical_decoupling": {"sequence_type": "XY4"}},
-            ),
-            ({"default_shots": 2000}, {"default_shots": 2000}),
-            (
-                {"execution": {"init_qubits": True}},
-                {"execution": {"init_qubits": True}},
-            ),
-        ]
-
-        for options, expected in options_vars:
-            with self.subTest(options=options):
-                inst = primitive(backend=backend)
-                inst.options.update(**options)
-                inst.run(**get_primitive_inputs(inst))
-                inputs = backend.service.run.call_args.kwargs["inputs"]["options"]
-                self._assert_dict_partially_equal(inputs, expected)
+        inst = primitive(backend=backend)
+        inst.options.update(**options)
+        inst.run(**get_primitive_inputs(inst))
+        inputs = backend.service.run.call_args.kwargs["inputs"]["options"]
+        self._assert_dict_partially_equal(inputs, options)
 
-    @data(EstimatorV2, SamplerV2)
-    def test_run_overwrite_runtime_options(self, primitive):
-        """Test run using overwritten runtime options."""
-        backend = get_mocked_backend()
-        options_vars = [
+    @combine(
+        primitive=[EstimatorV2, SamplerV2],
+        options=[
             {"environment": {"log_level": "DEBUG"}},
             {"environment": {"job_tags": ["foo", "bar"]}},
             {"max_execution_time": 600},
             {"environment": {"log_level": "INFO"}, "max_execution_time": 800},
-        ]
-        for options in options_vars:
-            with self.subTest(options=options):
-                inst = primitive(backend=backend)
-                inst.options.update(**options)
-                inst.run(**get_primitive_inputs(inst))
-                runtime_options = primitive._options_class._get_runtime_options(options)
-                rt_options = backend.service.run.call_args.kwargs["options"]
-                self._assert_dict_partially_equal(rt_options, runtime_options)
+        ],
+    )
+    def test_run_overwrite_runtime_options(self, primitive, options):
+        """Test run using overwritten runtime options."""
+        backend = get_mocked_backend()
+        inst = primitive(backend=backend)
+        inst.options.update(**options)
+        inst.run(**get_primitive_inputs(inst))
+        runtime_options = primitive._options_class._get_runtime_options(options)
+        rt_options = backend.service.run.call_args.kwargs["options"]
+        self._assert_dict_partially_equal(rt_options, runtime_options)
 
     @combine(
         primitive=[EstimatorV2, SamplerV2],
@@ -450,9 +476,10 @@ class TestPrimitivesV2(IBMTestCase):
         """Test multiple runs with different options."""
         backend = get_mocked_backend()
         inst = primitive(backend=backend, options={"default_shots": 100})
-        inst.run(**get_primitive_inputs(inst))
+        inputs = get_primitive_inputs(inst)
+        inst.run(**inputs)
         inst.options.update(default_shots=200)
-        inst.run(**get_primitive_inputs(inst))
+        inst.run(**inputs)
         kwargs_list = backend.service.run.call_args_list
         for idx, shots in zip([0, 1], [100, 200]):
             self.assertEqual(kwargs_list[idx][1]["inputs"]["options"]["default_shots"], shots)
@@ -490,20 +517,18 @@ class TestPrimitivesV2(IBMTestCase):
             f"inst_options={inst_options}, new_opt={new_opts}",
         )
         # Make sure the structure didn't change.
+        default_options = asdict(opt_cls())
         self.assertTrue(
-            dict_keys_equal(inst_options, asdict(opt_cls())),
-            f"inst_options={inst_options}, original={opt_cls()}",
+            dict_keys_equal(inst_options, default_options),
+            f"inst_options={inst_options}, original={default_options}",
         )
 
     @data(EstimatorV2, SamplerV2)
     def test_raise_faulty_qubits(self, primitive):
         """Test faulty qubits is raised."""
-        fake_backend = FakeManila()
+        fake_backend = self.fake_manila
         num_qubits = fake_backend.configuration().num_qubits
-        circ = QuantumCircuit(num_qubits, num_qubits)
-        for i in range(num_qubits):
-            circ.x(i)
-        transpiled = transpile(circ, backend=fake_backend)
+        transpiled = self.manila_x_all.copy()
         observable = SparsePauliOp("Z" * num_qubits)
 
         faulty_qubit = 4
@@ -527,15 +552,9 @@ class TestPrimitivesV2(IBMTestCase):
     @data(EstimatorV2, SamplerV2)
     def test_raise_faulty_qubits_many(self, primitive):
         """Test faulty qubits is raised if one circuit uses it."""
-        fake_backend = FakeManila()
+        fake_backend = self.fake_manila
         num_qubits = fake_backend.configuration().num_qubits
-
-        circ1 = QuantumCircuit(1, 1)
-        circ1.x(0)
-        circ2 = QuantumCircuit(num_qubits, num_qubits)
-        for i in range(num_qubits):
-            circ2.x(i)
-        transpiled = transpile([circ1, circ2], backend=fake_backend)
+        transpiled = [self.manila_x_1q.copy(), self.manila_x_all.copy()]
         observable = SparsePauliOp("Z" * num_qubits)
 
         faulty_qubit = 4
@@ -559,12 +578,9 @@ class TestPrimitivesV2(IBMTestCase):
     @data(EstimatorV2, SamplerV2)
     def test_raise_faulty_edge(self, primitive):
         """Test faulty edge is raised."""
-        fake_backend = FakeManila()
+        fake_backend = self.fake_manila
         num_qubits = fake_backend.configuration().num_qubits
-        circ = QuantumCircuit(num_qubits, num_qubits)
-        for i in range(num_qubits - 2):
-            circ.cx(i, i + 1)
-        transpiled = transpile(circ, backend=fake_backend)
+        transpiled = self.manila_cx_chain.copy()
         observable = SparsePauliOp("Z" * num_qubits)
 
         edge_qubits = [0, 1]
@@ -588,11 +604,8 @@ class TestPrimitivesV2(IBMTestCase):
     @data(EstimatorV2, SamplerV2)
     def test_faulty_qubit_not_used(self, primitive):
         """Test faulty qubit is not raise if not used."""
-        fake_backend = FakeManila()
-        circ = QuantumCircuit(2, 2)
-        for i in range(2):
-            circ.x(i)
-        transpiled = transpile(circ, backend=fake_backend, initial_layout=[0, 1])
+        fake_backend = self.fake_manila
+        transpiled = self.manila_x_2q.copy()
         observable = SparsePauliOp("Z" * fake_backend.configuration().num_qubits)
 
         faulty_qubit = 4
@@ -616,13 +629,9 @@ class TestPrimitivesV2(IBMTestCase):
     @data(EstimatorV2, SamplerV2)
     def test_faulty_edge_not_used(self, primitive):
         """Test faulty edge is not raised if not used."""
-        fake_backend = FakeManila()
+        fake_backend = self.fake_manila
         coupling_map = fake_backend.configuration().coupling_map
-
-        circ = QuantumCircuit(2, 2)
-        circ.cx(0, 1)
-
-        transpiled = transpile(circ, backend=fake_backend, initial_layout=coupling_map[0])
+        transpiled = self.manila_cx_2q.copy()
         observable = SparsePauliOp("Z" * fake_backend.configuration().num_qubits)
 
         edge_qubits = coupling_map[-1]
@@ -659,13 +668,6 @@ class TestPrimitivesV2(IBMTestCase):
         with self.assertRaisesRegex(IBMInputValueError, "target hardware"):
             inst.run(pubs=[tuple(pub)])
 
-    def _update_dict(self, dict1, dict2):
-        for key, val in dict1.items():
-            if isinstance(val, dict):
-                self._update_dict(val, dict2.pop(key, {}))
-            elif key in dict2.keys():
-                dict1[key] = dict2.pop(key)
-
     def _assert_dict_partially_equal(self, dict1, dict2):
         """Assert all keys in dict2 are in dict1 and have same values."""
         self.assertTrue(
@@ -19,7 +19,7 @@ from unittest.mock import MagicMock, patch
 from qiskit.providers.exceptions import QiskitBackendNotFoundError
 from qiskit.providers.jobstatus import JobStatus
 
-from qiskit_ibm_runtime import RuntimeJob
+from qiskit_ibm_runtime import RuntimeJob, RuntimeJobV2
 from qiskit_ibm_runtime.constants import API_TO_JOB_ERROR_MESSAGE
 from qiskit_ibm_runtime.exceptions import (
     RuntimeJobFailureError,
@@ -248,3 +248,60 @@ class TestRuntimeJob(IBMTestCase):
                     result = job.result()
 
         self.assertTrue(result)
+
+    def test_wait_for_final_state_backoff(self):
+        """Test status polling backs off while the job status does not change."""
+        job = RuntimeJobV2(
+            backend=None,
+            api_client=MagicMock(),
+            client_params=MagicMock(),
+            job_id="job_id",
+            program_id="sampler",
+            service=MagicMock(),
+        )
+        statuses = ["QUEUED"] * 4 + ["RUNNING"] * 2 + ["DONE"]
+        with patch.object(job, "_start_websocket_client"), patch.object(
+            job, "status", side_effect=statuses
+        ), patch("qiskit_ibm_runtime.runtime_job_v2.time.sleep") as sleep_mock:
+            job.wait_for_final_state()
+        delays = [call.args[0] for call in sleep_mock.call_args_list]
+        self.assertEqual(len(delays), len(statuses) - 1)
+        self.assertEqual(delays[:3], sorted(delays[:3]))
+        self.assertLess(delays[0], delays[2])
+        # The delay resets after the status changes from QUEUED to RUNNING.
+        self.assertEqual(delays[4], delays[0])
+
+    def test_status_predicates_share_fetch(self):
+        """Test back-to-back status predicates fetch the job status once."""
+        api_client = MagicMock()
+        api_client.job_get.return_value = {"state": {"status": "Running"}}
+        job = RuntimeJobV2(
+            backend=None,
+            api_client=api_client,
+            client_params=MagicMock(),
+            job_id="job_id",
+            program_id="sampler",
+            service=MagicMock(),
+        )
+        self.assertFalse(job.done())
+        self.assertFalse(job.errored())
+        self.assertTrue(job.running())
+        self.assertEqual(api_client.job_get.call_count, 1)
+
+    def test_status_and_backend_share_fetch(self):
+        """Test the backend lookup reuses the job fetched for its status."""
+        api_client = MagicMock()
+        api_client.job_get.return_value = {"state": {"status": "Completed"}, "backend": "ibm_foo"}
+        service = MagicMock()
+        job = RuntimeJobV2(
+            backend=None,
+            api_client=api_client,
+            client_params=MagicMock(),
+            job_id="job_id",
+            program_id="sampler",
+            service=service,
+        )
+        self.assertEqual(job.status(), "DONE")
+        self.assertEqual(job.backend(), service.backend.return_value)
+        service.backend.assert_called_once_with("ibm_foo")
+        self.assertEqual(api_client.job_get.call_count, 1)
@@ -12,11 +12,24 @@
 
 """Tests for the RuntimeClient class."""
 
+from datetime import datetime, timedelta, timezone
+import math
+from unittest import mock
+from urllib.parse import urlencode
+
+from requests import Response
+
 from qiskit_ibm_runtime.api.client_parameters import ClientParameters
 from qiskit_ibm_runtime.api.clients import RuntimeClient
 from qiskit_ibm_runtime.api.exceptions import RequestsApiError
+from qiskit_ibm_runtime.api.rest.base import (
+    _RESPONSE_CACHE,
+    clear_response_cache,
+    json_from_response,
+)
+from qiskit_ibm_runtime.utils.converters import local_to_utc
 
-from .mock.http_server import SimpleServer, ClientErrorHandler
+from .mock.http_server import SimpleServer, BaseHandler, ClientErrorHandler, EchoPathHandler
 from ..ibm_test_case import IBMTestCase
 from ..account import custom_envs, no_envs
 
@@ -28,6 +41,7 @@ class TestAccountClient(IBMTestCase):
         """Initial test setup."""
         super().setUp()
         self.fake_server = None
+        clear_response_cache()
 
     def tearDown(self) -> None:
         """Test level tear down."""
@@ -35,7 +49,7 @@ class TestAccountClient(IBMTestCase):
         if self.fake_server:
             self.fake_server.stop()
 
-    def _get_client(self):
+    def _get_client(self, verify=True):
         """Helper for instantiating an RuntimeClient."""
         # pylint: disable=no-value-for-parameter
         params = ClientParameters(
@@ -43,6 +57,7 @@ class TestAccountClient(IBMTestCase):
             url=SimpleServer.URL,
             token="foo",
             instance="h/g/p",
+            verify=verify,
         )
         return RuntimeClient(params)
 
@@ -85,3 +100,109 @@ class TestAccountClient(IBMTestCase):
             client._session.custom_header = None
             client._session._set_custom_header()
             self.assertNotIn(custom_header, client._session.headers["X-Qx-Client-Application"])
+
+    def test_client_app_header_caller(self):
+        """Check the calling module is reported in the client application header."""
+        client = self._get_client()
+        self.fake_server = SimpleServer(handler_class=BaseHandler)
+        self.fake_server.start()
+        self.fake_server.set_good_response({"devices": []})
+
+        with no_envs(["USAGE_DATA_OPT_OUT"]):
+            code = compile("client.list_backends()", "qiskit_nature/solver.py", "exec")
+            exec(code, {"client": client})  # pylint: disable=exec-used
+        self.assertTrue(
+            client._session.headers["X-Qx-Client-Application"].endswith("/qiskit_nature~solver.py")
+        )
+
+    def test_sessions_share_connection_pool(self):
+        """Test clients with the same retry policy share the connection pool."""
+        client1 = self._get_client()
+        client2 = self._get_client()
+        adapter = client1._session.get_adapter("https://")
+        self.assertIs(adapter, client2._session.get_adapter("https://"))
+        client1._session.close()
+        self.assertIs(adapter, client2._session.get_adapter("https://"))
+
+    def test_sessions_verify_separate_connection_pool(self):
+        """Test clients with different SSL verification do not share the connection pool."""
+        client1 = self._get_client(verify=True)
+        client2 = self._get_client(verify=False)
+        self.assertIsNot(
+            client1._session.get_adapter("https://"), client2._session.get_adapter("https://")
+        )
+        self.assertIs(
+            client2._session.get_adapter("https://"),
+            self._get_client(verify=False)._session.get_adapter("https://"),
+        )
+
+    def test_backends_response_cached(self):
+        """Test the list of backends is cached between calls."""
+        client = self._get_client()
+        self.fake_server = SimpleServer(handler_class=BaseHandler)
+        self.fake_server.start()
+
+        self.fake_server.set_good_response({"devices": ["ibm_gotham"]})
+        self.assertEqual(client.list_backends(), ["ibm_gotham"])
+        self.fake_server.set_good_response({"devices": ["ibm_metropolis"]})
+        self.assertEqual(client.list_backends(), ["ibm_gotham"])
+        self.assertEqual(client.list_backends(hgp="h/g/p"), ["ibm_metropolis"])
+
+        clear_response_cache()
+        self.assertEqual(client.list_backends(), ["ibm_metropolis"])
+
+    def test_response_cache_bounded(self):
+        """Test expired and excess responses are evicted from the cache."""
+        client = self._get_client()
+        self.fake_server = SimpleServer(handler_class=BaseHandler)
+        self.fake_server.start()
+        self.fake_server.set_good_response({"devices": ["ibm_gotham"]})
+
+        with mock.patch("qiskit_ibm_runtime.api.rest.base._RESPONSE_CACHE_MAXSIZE", 2):
+            for hgp in ["h/g/p1", "h/g/p2", "h/g/p3"]:
+                client.list_backends(hgp=hgp)
+            self.assertEqual(len(_RESPONSE_CACHE), 2)
+
+        clear_response_cache()
+        with mock.patch("qiskit_ibm_runtime.api.rest.runtime.BACKENDS_CACHE_TTL", 0):
+            client.list_backends(hgp="h/g/p1")
+            client.list_backends(hgp="h/g/p2")
+        self.assertEqual(len(_RESPONSE_CACHE), 1)
+
+    def test_jobs_get_query_string(self):
+        """Test the job filters are encoded in the query string."""
+        client = self._get_client()
+        self.fake_server = SimpleServer(handler_class=EchoPathHandler)
+        self.fake_server.start()
+
+        for _ in range(2):
+            path = client.jobs_get(limit=5, pending=False, job_tags=["a b", "c"])["path"]
+            self.assertEqual(
+                path,
+                "/jobs?exclude_params=False&limit=5&pending=false&tags=a+b&tags=c",
+            )
+
+    def test_jobs_get_created_after(self):
+        """Test equal instants with different offsets are converted separately."""
+        client = self._get_client()
+        self.fake_server = SimpleServer(handler_class=EchoPathHandler)
+        self.fake_server.start()
+
+        utc_dt = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        for created_after in (utc_dt, utc_dt.astimezone(timezone(timedelta(hours=1)))):
+            with self.subTest(created_after=created_after):
+                expected = local_to_utc(created_after).isoformat()
+                path = client.jobs_get(created_after=created_after)["path"]
+                self.assertEqual(
+                    path,
+                    "/jobs?exclude_params=False&" + urlencode({"created_after": expected}),
+                )
+
+    def test_json_from_response_non_standard(self):
+        """Test bodies outside orjson's JSON subset are still decoded."""
+        response = Response()
+        response._content = b'{"nan": NaN, "big": 18446744073709551616}'
+        response.encoding = "utf-8"
+        decoded = json_from_response(response)
+        self.assertTrue(math.isnan(decoded["nan"]))
+        self.assertEqual(decoded["big"], 2**64)
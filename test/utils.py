@@ -17,6 +17,7 @@ import logging
 import time
 import itertools
 import unittest
+from functools import lru_cache
 from unittest import mock
 from typing import Dict, Optional, Any
 from datetime import datetime
@@ -435,9 +436,8 @@ def get_transpiled_circuit(backend, num_qubits=2, measure=False):
     return transpile(circ, backend=backend)
 
 
-def get_primitive_inputs(primitive, backend=None, num_sets=1):
-    """Return primitive specific inputs."""
-    backend = backend or FakeManila()
+def _transpiled_primitive_circuit(backend):
+    """Return the parametrized circuit and observable used as primitive inputs."""
     theta = Parameter("θ")
     circ = QuantumCircuit(2)
     circ.h(0)
@@ -447,6 +447,23 @@ def get_primitive_inputs(primitive, backend=None, num_sets=1):
     circ = transpile(circ, backend=backend)
     obs = SparsePauliOp.from_list([("IZ", 1)])
     obs = obs.apply_layout(circ.layout, num_qubits=circ.num_qubits)
+    return circ, obs
+
+
+@lru_cache(maxsize=1)
+def _default_primitive_circuit():
+    """Return the primitive inputs circuit and observable for ``FakeManila``, transpiled once."""
+    return _transpiled_primitive_circuit(FakeManila())
+
+
+def get_primitive_inputs(primitive, backend=None, num_sets=1):
+    """Return primitive specific inputs."""
+    if backend is None:
+        circ, obs = _default_primitive_circuit()
+        # Samplers add measurements in place.
+        circ = circ.copy()
+    else:
+        circ, obs = _transpiled_primitive_circuit(backend)
     param_val = [0.1]
 
     if isinstance(primitive, EstimatorV2):